@@ -151,10 +151,14 @@ async def list_escalations(
     db: DatabaseSession,
     status_filter: EscalationStatus | None = None,
     ticket_id: UUID | None = None,
+    count_only: bool = False,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
 ) -> EscalationListResponse:
-    """List escalation requests (support sees own team, managers see all)."""
+    """List escalation requests (support sees own team, managers see all).
+
+    With ``count_only`` set, only the total is computed and ``items`` is empty.
+    """
     # Build base query with join to Ticket for team filtering
     query = select(EscalationRequest).join(Ticket)
 
@@ -177,6 +181,9 @@ async def list_escalations(
     count_query = select(func.count()).select_from(query.subquery())
     total = (await db.execute(count_query)).scalar() or 0
 
+    if count_only:
+        return EscalationListResponse(items=[], total=total)
+
     # Get paginated results
     query = (
         query.options(
@@ -104,7 +104,8 @@ def generate_otp_code(length: int = 6) -> str:
     Returns:
         A random numeric OTP code.
     """
-    return "".join(secrets.choice("0123456789") for _ in range(length))
+    # Single CSPRNG draw, zero-padded to keep leading zeros
+    return f"{secrets.randbelow(10**length):0{length}d}"
 
 
 def get_otp_expiry() -> datetime:
@@ -3,6 +3,7 @@
 import factory
 import factory.fuzzy
 from datetime import datetime, timezone
+import itertools
 import uuid
 from app.models.user import User, UserRole
 from app.models.ticket import Ticket, TicketStatus, Location
@@ -12,6 +13,17 @@ from app.models.comment import Comment
 from app.models.feedback import Feedback
 from app.models.notification import Notification, NotificationType
 
+# Fixed timestamp for mock rows; tests never compare against the clock
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+_fake_uuid_counter = itertools.count(1)
+
+
+def fake_uuid() -> uuid.UUID:
+    """Unique, deterministic UUID for mock-only tests that never hit the DB."""
+    return uuid.UUID(int=next(_fake_uuid_counter))
+
+
 class UserFactory(factory.Factory):
     class Meta:
         model = User
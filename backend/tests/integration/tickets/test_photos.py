@@ -4,7 +4,6 @@ import io
 import uuid
 from unittest.mock import AsyncMock, patch
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,7 +20,6 @@ from tests.conftest import auth_headers
 class TestUploadReportPhoto:
     """Tests for uploading REPORT photos (by citizens)."""
 
-    @pytest.mark.asyncio
     async def test_reporter_can_upload_report_photo(
         self,
         client: AsyncClient,
@@ -54,7 +52,6 @@ class TestUploadReportPhoto:
         assert "url" in data
         assert "id" in data
 
-    @pytest.mark.asyncio
     async def test_reporter_upload_defaults_to_report_type(
         self,
         client: AsyncClient,
@@ -83,7 +80,6 @@ class TestUploadReportPhoto:
 
         assert response.status_code == 201
 
-    @pytest.mark.asyncio
     async def test_non_reporter_cannot_upload_report_photo(
         self,
         client: AsyncClient,
@@ -124,7 +120,6 @@ class TestUploadReportPhoto:
 class TestUploadProofPhoto:
     """Tests for uploading PROOF photos (by staff)."""
 
-    @pytest.mark.asyncio
     async def test_support_can_upload_proof_photo(
         self,
         client: AsyncClient,
@@ -155,7 +150,6 @@ class TestUploadProofPhoto:
         data = response.json()
         assert data["filename"] == "proof.jpg"
 
-    @pytest.mark.asyncio
     async def test_manager_can_upload_proof_photo(
         self,
         client: AsyncClient,
@@ -186,7 +180,6 @@ class TestUploadProofPhoto:
         data = response.json()
         assert data["filename"] == "manager_proof.jpg"
 
-    @pytest.mark.asyncio
     async def test_citizen_cannot_upload_proof_photo(
         self,
         client: AsyncClient,
@@ -209,7 +202,6 @@ class TestUploadProofPhoto:
 class TestPhotoUploadErrors:
     """Tests for error cases in photo upload."""
 
-    @pytest.mark.asyncio
     async def test_upload_to_nonexistent_ticket_returns_404(
         self,
         client: AsyncClient,
@@ -227,7 +219,6 @@ class TestPhotoUploadErrors:
 
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_unauthenticated_upload_returns_401(
         self,
         client: AsyncClient,
@@ -243,7 +234,6 @@ class TestPhotoUploadErrors:
 
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_storage_failure_returns_error(
         self,
         client: AsyncClient,
@@ -1,17 +1,83 @@
 """Tests for escalation API endpoints."""
 
+import asyncio
+import uuid
+from collections.abc import Generator
+from typing import Annotated
+
 import pytest
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials
 from httpx import AsyncClient
 
+from app.api.deps import get_current_user, security
+from app.core.exceptions import UnauthorizedException
+from app.models import User, UserRole
+from main import app
 from tests.conftest import auth_headers
 
+pytestmark = pytest.mark.usefixtures("pre_warm")
+
+
+# ============================================================================
+# In-memory authentication for authorization-boundary tests
+# ============================================================================
+
+CITIZEN_STUB_TOKEN = "stub-citizen-token"
+SUPPORT_STUB_TOKEN = "stub-support-token"
+
+_FAKE_USERS_BY_TOKEN: dict[str, User] = {
+    CITIZEN_STUB_TOKEN: User(
+        id=uuid.uuid4(),
+        phone_number="+905551234567",
+        name="Stub Citizen",
+        role=UserRole.CITIZEN,
+        is_verified=True,
+        is_active=True,
+    ),
+    SUPPORT_STUB_TOKEN: User(
+        id=uuid.uuid4(),
+        phone_number="+905559876543",
+        name="Stub Support",
+        role=UserRole.SUPPORT,
+        is_verified=True,
+        is_active=True,
+        team_id=uuid.uuid4(),
+    ),
+}
+
+
+def fake_user_for_token(token: str) -> User:
+    """Resolve a stub bearer token to its pre-built user."""
+    user = _FAKE_USERS_BY_TOKEN.get(token)
+    if user is None:
+        raise UnauthorizedException(detail="User not found")
+    return user
+
+
+@pytest.fixture
+def stub_current_user() -> Generator[None, None, None]:
+    """Resolve the current user from memory instead of the database.
+
+    Only suitable for tests that assert on role checks (401/403), since the
+    stub users are never persisted.
+    """
+
+    async def override_get_current_user(
+        credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    ) -> User:
+        return fake_user_for_token(credentials.credentials)
+
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    yield
+    app.dependency_overrides.pop(get_current_user, None)
+
 
 # ============================================================================
 # POST /api/v1/escalations - Create escalation
 # ============================================================================
 
 
-@pytest.mark.asyncio
 async def test_support_creates_escalation_for_own_team_ticket(
     client: AsyncClient,
     ticket,
@@ -30,7 +96,6 @@ async def test_support_creates_escalation_for_own_team_ticket(
     assert data["status"] == "PENDING"
 
 
-@pytest.mark.asyncio
 async def test_support_cannot_escalate_another_teams_ticket(
     client: AsyncClient,
     ticket,
@@ -46,7 +111,6 @@ async def test_support_cannot_escalate_another_teams_ticket(
     assert "your team" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
 async def test_support_cannot_escalate_unassigned_ticket(
     client: AsyncClient,
     unassigned_ticket,
@@ -62,28 +126,22 @@ async def test_support_cannot_escalate_unassigned_ticket(
     assert "unassigned" in response.json()["detail"].lower()
 
 
-@pytest.mark.asyncio
-async def test_citizen_cannot_create_escalation(
-    client: AsyncClient,
-    ticket,
-    citizen_token: str,
-):
+@pytest.mark.usefixtures("stub_current_user")
+async def test_citizen_cannot_create_escalation(client: AsyncClient):
     """Citizen users cannot create escalations."""
     response = await client.post(
         "/api/v1/escalations",
-        json={"ticket_id": str(ticket.id), "reason": "Citizen trying to escalate"},
-        headers=auth_headers(citizen_token),
+        json={"ticket_id": str(uuid.uuid4()), "reason": "Citizen trying to escalate"},
+        headers=auth_headers(CITIZEN_STUB_TOKEN),
     )
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 async def test_escalation_ticket_not_found(
     client: AsyncClient,
     support_with_team_token: str,
 ):
     """Creating escalation for non-existent ticket returns 404."""
-    import uuid
     response = await client.post(
         "/api/v1/escalations",
         json={"ticket_id": str(uuid.uuid4()), "reason": "Non-existent ticket"},
@@ -92,7 +150,6 @@ async def test_escalation_ticket_not_found(
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_cannot_escalate_with_pending_escalation(
     client: AsyncClient,
     escalation,
@@ -107,7 +164,6 @@ async def test_cannot_escalate_with_pending_escalation(
     assert response.status_code == 409
 
 
-@pytest.mark.asyncio
 async def test_can_reescalate_after_rejection(
     client: AsyncClient,
     rejected_escalation,
@@ -125,7 +181,6 @@ async def test_can_reescalate_after_rejection(
     assert data["reason"] == "Re-escalating after rejection"
 
 
-@pytest.mark.asyncio
 async def test_cannot_reescalate_after_approval(
     client: AsyncClient,
     approved_escalation,
@@ -146,7 +201,6 @@ async def test_cannot_reescalate_after_approval(
 # ============================================================================
 
 
-@pytest.mark.asyncio
 async def test_manager_sees_all_escalations(
     client: AsyncClient,
     escalation,
@@ -163,7 +217,6 @@ async def test_manager_sees_all_escalations(
     assert len(data["items"]) >= 1
 
 
-@pytest.mark.asyncio
 async def test_support_sees_only_own_team_escalations(
     client: AsyncClient,
     escalation,
@@ -180,7 +233,6 @@ async def test_support_sees_only_own_team_escalations(
     assert data["total"] >= 1
 
 
-@pytest.mark.asyncio
 async def test_support_other_team_sees_no_escalations(
     client: AsyncClient,
     escalation,
@@ -198,15 +250,27 @@ async def test_support_other_team_sees_no_escalations(
     assert len(data["items"]) == 0
 
 
-@pytest.mark.asyncio
-async def test_citizen_cannot_list_escalations(
+async def test_support_other_team_count_only(
     client: AsyncClient,
-    citizen_token: str,
+    escalation,
+    support_other_team_token: str,
 ):
+    """count_only applies the same team filter to the total."""
+    response = await client.get(
+        "/api/v1/escalations",
+        params={"count_only": "true"},
+        headers=auth_headers(support_other_team_token),
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+
+@pytest.mark.usefixtures("stub_current_user")
+async def test_citizen_cannot_list_escalations(client: AsyncClient):
     """Citizen users cannot list escalations."""
     response = await client.get(
         "/api/v1/escalations",
-        headers=auth_headers(citizen_token),
+        headers=auth_headers(CITIZEN_STUB_TOKEN),
     )
     assert response.status_code == 403
 
@@ -216,7 +280,6 @@ async def test_citizen_cannot_list_escalations(
 # ============================================================================
 
 
-@pytest.mark.asyncio
 async def test_support_can_view_escalation(
     client: AsyncClient,
     escalation,
@@ -232,13 +295,11 @@ async def test_support_can_view_escalation(
     assert data["id"] == str(escalation.id)
 
 
-@pytest.mark.asyncio
 async def test_escalation_not_found(
     client: AsyncClient,
     support_with_team_token: str,
 ):
     """Getting non-existent escalation returns 404."""
-    import uuid
     response = await client.get(
         f"/api/v1/escalations/{uuid.uuid4()}",
         headers=auth_headers(support_with_team_token),
@@ -251,7 +312,6 @@ async def test_escalation_not_found(
 # ============================================================================
 
 
-@pytest.mark.asyncio
 async def test_manager_approves_escalation(
     client: AsyncClient,
     escalation,
@@ -269,27 +329,11 @@ async def test_manager_approves_escalation(
     assert data["review_comment"] == "Approved by manager"
 
 
-@pytest.mark.asyncio
-async def test_support_cannot_approve_escalation(
-    client: AsyncClient,
-    escalation,
-    support_with_team_token: str,
-):
-    """Support users cannot approve escalations."""
-    response = await client.patch(
-        f"/api/v1/escalations/{escalation.id}/approve",
-        json={"comment": "Support trying to approve"},
-        headers=auth_headers(support_with_team_token),
-    )
-    assert response.status_code == 403
-
-
 # ============================================================================
 # PATCH /api/v1/escalations/{id}/reject - Reject escalation
 # ============================================================================
 
 
-@pytest.mark.asyncio
 async def test_manager_rejects_escalation(
     client: AsyncClient,
     escalation,
@@ -307,16 +351,19 @@ async def test_manager_rejects_escalation(
     assert data["review_comment"] == "Not a valid escalation reason"
 
 
-@pytest.mark.asyncio
-async def test_support_cannot_reject_escalation(
-    client: AsyncClient,
-    escalation,
-    support_with_team_token: str,
-):
-    """Support users cannot reject escalations."""
-    response = await client.patch(
-        f"/api/v1/escalations/{escalation.id}/reject",
-        json={"comment": "Support trying to reject"},
-        headers=auth_headers(support_with_team_token),
+@pytest.mark.usefixtures("stub_current_user")
+async def test_support_cannot_review_escalation(client: AsyncClient):
+    """Support users can neither approve nor reject escalations."""
+    # Both requests are rejected by the role check before any DB access,
+    # so they can share the test connection concurrently.
+    responses = await asyncio.gather(
+        *(
+            client.patch(
+                f"/api/v1/escalations/{uuid.uuid4()}/{action}",
+                json={"comment": f"Support trying to {action}"},
+                headers=auth_headers(SUPPORT_STUB_TOKEN),
+            )
+            for action in ("approve", "reject")
+        )
     )
-    assert response.status_code == 403
+    assert [r.status_code for r in responses] == [403, 403]
@@ -1,8 +1,11 @@
 """Tests for user management endpoints."""
 
 import uuid
+from datetime import datetime, timezone
 
+import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
 
 from app.models import User
 from app.models.team import Team
@@ -13,12 +16,12 @@ class TestListUsers:
     """Tests for GET /api/v1/users/."""
 
     async def test_list_users_as_manager(
-        self, client: AsyncClient, manager_user: User, manager_token: str
+        self, client: AsyncClient, manager_user: User, manager_headers: dict[str, str]
     ):
         """Manager should be able to list all users."""
         response = await client.get(
             "/api/v1/users/",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -29,42 +32,37 @@ class TestListUsers:
         assert "page_size" in data
         assert len(data["items"]) >= 1
 
-    async def test_list_users_as_support(
-        self, client: AsyncClient, support_user: User, support_token: str
-    ):
-        """Support user should not be able to list users."""
-        response = await client.get(
-            "/api/v1/users/",
-            headers={"Authorization": f"Bearer {support_token}"},
-        )
-        assert response.status_code == 403
-
-    async def test_list_users_as_citizen(
-        self, client: AsyncClient, citizen_user: User, citizen_token: str
+    @pytest.mark.parametrize(
+        "headers_fixture,expected_status",
+        [
+            ("support_headers", 403),
+            ("citizen_headers", 403),
+            (None, 401),
+        ],
+    )
+    async def test_list_users_denied(
+        self,
+        client: AsyncClient,
+        request: pytest.FixtureRequest,
+        headers_fixture: str | None,
+        expected_status: int,
     ):
-        """Citizen should not be able to list users."""
-        response = await client.get(
-            "/api/v1/users/",
-            headers={"Authorization": f"Bearer {citizen_token}"},
-        )
-        assert response.status_code == 403
-
-    async def test_list_users_unauthenticated(self, client: AsyncClient):
-        """Unauthenticated request should be rejected."""
-        response = await client.get("/api/v1/users/")
-        assert response.status_code == 401
+        """Only managers may list users; others are rejected."""
+        headers = request.getfixturevalue(headers_fixture) if headers_fixture else {}
+        response = await client.get("/api/v1/users/", headers=headers)
+        assert response.status_code == expected_status
 
 
 class TestGetUser:
     """Tests for GET /api/v1/users/{user_id}."""
 
     async def test_get_own_user(
-        self, client: AsyncClient, citizen_user: User, citizen_token: str
+        self, client: AsyncClient, citizen_user: User, citizen_headers: dict[str, str]
     ):
         """User should be able to get their own profile."""
         response = await client.get(
             f"/api/v1/users/{citizen_user.id}",
-            headers={"Authorization": f"Bearer {citizen_token}"},
+            headers=citizen_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -76,12 +74,12 @@ class TestGetUser:
         client: AsyncClient,
         citizen_user: User,
         support_user: User,
-        citizen_token: str,
+        citizen_headers: dict[str, str],
     ):
         """Citizen should not be able to get another user's profile."""
         response = await client.get(
             f"/api/v1/users/{support_user.id}",
-            headers={"Authorization": f"Bearer {citizen_token}"},
+            headers=citizen_headers,
         )
         assert response.status_code == 403
 
@@ -90,12 +88,12 @@ class TestGetUser:
         client: AsyncClient,
         manager_user: User,
         citizen_user: User,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Manager should be able to get any user's profile."""
         response = await client.get(
             f"/api/v1/users/{citizen_user.id}",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -106,12 +104,12 @@ class TestUpdateUser:
     """Tests for PUT /api/v1/users/{user_id}."""
 
     async def test_update_own_profile(
-        self, client: AsyncClient, citizen_user: User, citizen_token: str
+        self, client: AsyncClient, citizen_user: User, citizen_headers: dict[str, str]
     ):
         """User should be able to update their own profile."""
         response = await client.put(
             f"/api/v1/users/{citizen_user.id}",
-            headers={"Authorization": f"Bearer {citizen_token}"},
+            headers=citizen_headers,
             json={"name": "Updated Name", "email": "updated@example.com"},
         )
         assert response.status_code == 200
@@ -124,12 +122,12 @@ class TestUpdateUser:
         client: AsyncClient,
         citizen_user: User,
         support_user: User,
-        citizen_token: str,
+        citizen_headers: dict[str, str],
     ):
         """User should not be able to update another user's profile."""
         response = await client.put(
             f"/api/v1/users/{support_user.id}",
-            headers={"Authorization": f"Bearer {citizen_token}"},
+            headers=citizen_headers,
             json={"name": "Hacked Name"},
         )
         assert response.status_code == 403
@@ -143,12 +141,12 @@ class TestUpdateUserRole:
         client: AsyncClient,
         citizen_user: User,
         manager_user: User,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Manager should be able to update user role."""
         response = await client.patch(
             f"/api/v1/users/{citizen_user.id}/role",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
             json={"role": "SUPPORT"},  # Role must be uppercase
         )
         assert response.status_code == 200
@@ -160,12 +158,12 @@ class TestUpdateUserRole:
         client: AsyncClient,
         citizen_user: User,
         support_user: User,
-        support_token: str,
+        support_headers: dict[str, str],
     ):
         """Support user should not be able to update roles."""
         response = await client.patch(
             f"/api/v1/users/{citizen_user.id}/role",
-            headers={"Authorization": f"Bearer {support_token}"},
+            headers=support_headers,
             json={"role": "manager"},
         )
         assert response.status_code == 403
@@ -174,12 +172,12 @@ class TestUpdateUserRole:
         self,
         client: AsyncClient,
         citizen_user: User,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Should reject invalid role value."""
         response = await client.patch(
             f"/api/v1/users/{citizen_user.id}/role",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
             json={"role": "admin"},  # Invalid role
         )
         assert response.status_code == 422
@@ -193,12 +191,12 @@ class TestDeleteUser:
         client: AsyncClient,
         citizen_user: User,
         manager_user: User,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Manager should be able to soft delete a user."""
         response = await client.delete(
             f"/api/v1/users/{citizen_user.id}",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         # DELETE returns 204 No Content on success
         assert response.status_code == 204
@@ -208,12 +206,12 @@ class TestDeleteUser:
         client: AsyncClient,
         support_user: User,
         citizen_user: User,
-        citizen_token: str,
+        citizen_headers: dict[str, str],
     ):
         """Citizen should not be able to delete users."""
         response = await client.delete(
             f"/api/v1/users/{support_user.id}",
-            headers={"Authorization": f"Bearer {citizen_token}"},
+            headers=citizen_headers,
         )
         assert response.status_code == 403
 
@@ -232,13 +230,13 @@ class TestListUsersFiltering:
         manager_user: User,
         support_user: User,
         citizen_user: User,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Should filter users by role."""
         response = await client.get(
             "/api/v1/users/",
             params={"role": "SUPPORT"},
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -252,13 +250,13 @@ class TestListUsersFiltering:
         manager_user: User,
         support_user_with_team: User,
         team: "Team",
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Should filter users by team_id."""
         response = await client.get(
             "/api/v1/users/",
             params={"team_id": str(team.id)},
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -270,33 +268,34 @@ class TestListUsersFiltering:
         self,
         client: AsyncClient,
         manager_user: User,
-        manager_token: str,
+        manager_headers: dict[str, str],
         db_session,
     ):
         """Should paginate results correctly."""
-        # Create additional users for pagination testing
-        from app.models.user import User as UserModel
-        import uuid
-
-        for i in range(5):
-            user = UserModel(
-                id=uuid.uuid4(),
-                phone_number=f"+90555999{i:04d}",
-                name=f"Pagination User {i}",
-                email=f"pagination{i}@test.com",
-                password_hash="hashed_password",
-                role=UserRole.CITIZEN,
-                is_verified=True,
-                is_active=True,
-            )
-            db_session.add(user)
+        # Create additional users for pagination testing in one multi-row INSERT
+        await db_session.execute(
+            insert(User),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "phone_number": f"+90555999{i:04d}",
+                    "name": f"Pagination User {i}",
+                    "email": f"pagination{i}@test.com",
+                    "password_hash": "hashed_password",
+                    "role": UserRole.CITIZEN,
+                    "is_verified": True,
+                    "is_active": True,
+                }
+                for i in range(5)
+            ],
+        )
         await db_session.commit()
 
         # Request page 1 with page_size 2
         response = await client.get(
             "/api/v1/users/",
             params={"page": 1, "page_size": 2},
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 200
         data = response.json()
@@ -314,30 +313,30 @@ class TestUpdateUserAdditional:
         client: AsyncClient,
         citizen_user: User,
         support_user: User,
-        citizen_token: str,
+        citizen_headers: dict[str, str],
     ):
         """Should reject update with duplicate phone number."""
         # Try to update citizen's phone to support's phone
         response = await client.put(
             f"/api/v1/users/{citizen_user.id}",
-            headers={"Authorization": f"Bearer {citizen_token}"},
+            headers=citizen_headers,
             json={"phone_number": support_user.phone_number},
         )
         assert response.status_code == 400
-        data = response.json()
-        assert "phone" in data["detail"].lower() or "use" in data["detail"].lower()
+        detail = response.json()["detail"].lower()
+        assert "phone" in detail or "use" in detail
 
     async def test_update_user_partial_update(
         self,
         client: AsyncClient,
         citizen_user: User,
-        citizen_token: str,
+        citizen_headers: dict[str, str],
     ):
         """Should allow partial updates (only name, not email)."""
         original_email = citizen_user.email
         response = await client.put(
             f"/api/v1/users/{citizen_user.id}",
-            headers={"Authorization": f"Bearer {citizen_token}"},
+            headers=citizen_headers,
             json={"name": "Only Name Updated"},
         )
         assert response.status_code == 200
@@ -355,12 +354,12 @@ class TestUpdateUserRoleAdditional:
         client: AsyncClient,
         citizen_user: User,
         team: "Team",
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Should assign user to team along with role change."""
         response = await client.patch(
             f"/api/v1/users/{citizen_user.id}/role",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
             json={"role": "SUPPORT", "team_id": str(team.id)},
         )
         assert response.status_code == 200
@@ -371,13 +370,13 @@ class TestUpdateUserRoleAdditional:
     async def test_update_role_nonexistent_user(
         self,
         client: AsyncClient,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Should return 404 for non-existent user."""
 
         response = await client.patch(
             f"/api/v1/users/{uuid.uuid4()}/role",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
             json={"role": "SUPPORT"},
         )
         assert response.status_code == 404
@@ -390,16 +389,12 @@ class TestDeleteUserAdditional:
         self,
         client: AsyncClient,
         db_session,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Verify that deleted user is soft deleted (not hard deleted)."""
-        from app.models.user import User as UserModel
-        from sqlalchemy import select
-        import uuid
-
         # Create a user to delete
         user_id = uuid.uuid4()
-        user = UserModel(
+        user = User(
             id=user_id,
             phone_number="+905559998877",
             name="To Be Deleted",
@@ -415,28 +410,25 @@ class TestDeleteUserAdditional:
         # Delete the user
         response = await client.delete(
             f"/api/v1/users/{user_id}",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 204
 
-        # Verify user still exists in DB but has deleted_at set
-        result = await db_session.execute(
-            select(UserModel).where(UserModel.id == user_id)
-        )
-        deleted_user = result.scalar_one_or_none()
-        assert deleted_user is not None
-        assert deleted_user.deleted_at is not None
+        # Verify user still exists in DB but has deleted_at set. refresh()
+        # reloads the row the test already holds; it raises if the row is gone.
+        await db_session.refresh(user)
+        assert user.deleted_at is not None
 
     async def test_delete_nonexistent_user(
         self,
         client: AsyncClient,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Should return 404 for non-existent user."""
 
         response = await client.delete(
             f"/api/v1/users/{uuid.uuid4()}",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 404
 
@@ -444,16 +436,12 @@ class TestDeleteUserAdditional:
         self,
         client: AsyncClient,
         db_session,
-        manager_token: str,
+        manager_headers: dict[str, str],
     ):
         """Deleted user should not be retrievable."""
-        from app.models.user import User as UserModel
-        from datetime import datetime, timezone
-        import uuid
-
         # Create a soft-deleted user
         user_id = uuid.uuid4()
-        user = UserModel(
+        user = User(
             id=user_id,
             phone_number="+905559997766",
             name="Already Deleted",
@@ -470,6 +458,6 @@ class TestDeleteUserAdditional:
         # Try to get the deleted user
         response = await client.get(
             f"/api/v1/users/{user_id}",
-            headers={"Authorization": f"Bearer {manager_token}"},
+            headers=manager_headers,
         )
         assert response.status_code == 404
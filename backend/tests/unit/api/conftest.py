@@ -0,0 +1,138 @@
+"""Shared fixtures for endpoint unit tests.
+
+These override the database-backed user fixtures from ``tests/conftest.py``
+with in-memory objects. Test classes that need different users still define
+their own fixtures, which take precedence.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.base import TimestampMixin
+from app.models.user import User, UserRole
+from tests.fixtures.factories import NOW, fake_uuid
+
+
+def fake_result(
+    *,
+    scalar: Any = None,
+    rows: Iterable[Any] = (),
+    scalars: Iterable[Any] = (),
+    scalar_one_or_none: Any = None,
+) -> SimpleNamespace:
+    """Lightweight stand-in for an SQLAlchemy ``Result``.
+
+    Exposes only the accessors the endpoints call: ``scalar()``, ``all()``,
+    ``scalars().all()``, ``unique()`` and ``scalar_one_or_none()``.
+    """
+    row_list = list(rows)
+    scalar_list = list(scalars)
+    result = SimpleNamespace(
+        scalar=lambda: scalar,
+        all=lambda: row_list,
+        scalars=lambda: SimpleNamespace(all=lambda: scalar_list),
+        scalar_one_or_none=lambda: scalar_one_or_none,
+    )
+    result.unique = lambda: result
+    return result
+
+
+async def populate_on_refresh(instance: Any) -> None:
+    """Fill the server-generated fields that a real ``refresh`` would load.
+
+    Assign to ``db.refresh`` so endpoints can serialize newly added rows.
+    """
+    instance.id = fake_uuid()
+    instance.created_at = NOW
+    if isinstance(instance, TimestampMixin):
+        instance.updated_at = NOW
+
+
+@pytest.fixture
+def citizen_user() -> User:
+    """Citizen user built fresh for each test."""
+    return User(
+        id=fake_uuid(),
+        phone_number="+905551234567",
+        name="Test Citizen",
+        role=UserRole.CITIZEN,
+    )
+
+
+@pytest.fixture
+def support_user() -> User:
+    """Support user built fresh for each test."""
+    return User(
+        id=fake_uuid(),
+        phone_number="+905559876543",
+        name="Support",
+        role=UserRole.SUPPORT,
+    )
+
+
+@pytest.fixture
+def manager_user() -> User:
+    """Manager user built fresh for each test."""
+    return User(
+        id=fake_uuid(),
+        phone_number="+905559999999",
+        name="Manager",
+        role=UserRole.MANAGER,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_request() -> SimpleNamespace:
+    """Stand-in FastAPI request; endpoints only read ``client.host``."""
+    return SimpleNamespace(client=SimpleNamespace(host="127.0.0.1"))
+
+
+class FakeAsyncDB:
+    """Minimal async session fake that replays queued results in order.
+
+    Cheaper than ``AsyncMock`` and fails loudly when an endpoint issues more
+    queries than the test expected.
+    """
+
+    def __init__(self) -> None:
+        self._results: deque[Any] = deque()
+        self.executes = 0
+        self.commits = 0
+        self.add = MagicMock()
+
+    def queue(self, result: Any) -> None:
+        """Queue the result for the next ``execute``/``scalar`` call."""
+        self._results.append(result)
+
+    def queue_many(self, *results: Any) -> None:
+        """Queue several results, consumed in order."""
+        self._results.extend(results)
+
+    def _next(self) -> Any:
+        if not self._results:
+            raise AssertionError("Unexpected query: no result queued")
+        return self._results.popleft()
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        self.executes += 1
+        return self._next()
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        return self._next().scalar()
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def refresh(self, instance: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def mock_db() -> FakeAsyncDB:
+    """Create a fake database session with no queued results."""
+    return FakeAsyncDB()
@@ -1,11 +1,10 @@
 """Unit tests for addresses API endpoints."""
 
-import uuid
-from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.addresses import (
     get_saved_addresses,
@@ -17,24 +16,24 @@ from app.api.v1.addresses import (
 from app.models.address import SavedAddress
 from app.models.user import User, UserRole
 from app.schemas.address import SavedAddressCreate, SavedAddressUpdate
+from tests.fixtures.factories import NOW, fake_uuid
+from tests.unit.api.conftest import populate_on_refresh
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock database session shared by all endpoint tests."""
+    return AsyncMock(spec=AsyncSession)
 
 
 class TestGetSavedAddresses:
     """Tests for get_saved_addresses endpoint."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = AsyncMock()
-        session.execute = AsyncMock()
-        session.scalar = AsyncMock()
-        return session
-
     @pytest.fixture
     def citizen_user(self):
         """Create a mock citizen user."""
         return User(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             phone_number="+905551234567",
             name="Test Citizen",
             role=UserRole.CITIZEN,
@@ -44,17 +43,16 @@ class TestGetSavedAddresses:
 
     async def test_get_saved_addresses_success(self, mock_session, citizen_user):
         """Should return list of saved addresses."""
-        now = datetime.now(timezone.utc)
         address = SavedAddress(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             user_id=citizen_user.id,
             name="Home",
             address="123 Main St",
             latitude=41.0082,
             longitude=28.9784,
             city="Istanbul",
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
         # Mock count query
@@ -92,22 +90,11 @@ class TestGetSavedAddresses:
 class TestCreateSavedAddress:
     """Tests for create_saved_address endpoint."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = AsyncMock()
-        session.execute = AsyncMock()
-        session.scalar = AsyncMock()
-        session.add = MagicMock()
-        session.commit = AsyncMock()
-        session.refresh = AsyncMock()
-        return session
-
     @pytest.fixture
     def citizen_user(self):
         """Create a mock citizen user."""
         return User(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             phone_number="+905551234567",
             name="Test Citizen",
             role=UserRole.CITIZEN,
@@ -115,7 +102,7 @@ class TestCreateSavedAddress:
 
     async def test_create_saved_address_success(self, mock_session, citizen_user):
         """Should create a new saved address."""
-        data = SavedAddressCreate(
+        data = SavedAddressCreate.model_construct(
             name="Home",
             address="123 Main St",
             latitude=41.0082,
@@ -126,12 +113,7 @@ class TestCreateSavedAddress:
         # Mock: no existing address with this name
         mock_session.scalar.side_effect = [None, 0]  # No existing, count = 0
 
-        async def mock_refresh(addr):
-            addr.id = uuid.uuid4()
-            addr.created_at = datetime.now(timezone.utc)
-            addr.updated_at = datetime.now(timezone.utc)
-
-        mock_session.refresh = mock_refresh
+        mock_session.refresh = populate_on_refresh
 
         result = await create_saved_address(data, citizen_user, mock_session)
 
@@ -139,63 +121,44 @@ class TestCreateSavedAddress:
         assert result.address == "123 Main St"
         mock_session.add.assert_called_once()
 
-    async def test_create_saved_address_duplicate_name(
-        self, mock_session, citizen_user
+    @pytest.mark.parametrize(
+        "scalar_results,detail",
+        [
+            # Existing address with this name
+            ([SavedAddress(id=fake_uuid(), name="Home")], "already exists"),
+            # No duplicate, but already at the maximum count
+            ([None, 10], "Maximum"),
+        ],
+        ids=["duplicate_name", "max_limit"],
+    )
+    async def test_create_saved_address_rejected(
+        self, mock_session, citizen_user, scalar_results, detail
     ):
-        """Should raise HTTPException for duplicate name."""
-        data = SavedAddressCreate(
+        """Should raise HTTPException for duplicate names and full address books."""
+        data = SavedAddressCreate.model_construct(
             name="Home",
             address="123 Main St",
             latitude=41.0082,
             longitude=28.9784,
             city="Istanbul",
         )
-
-        # Mock: existing address with this name
-        existing = SavedAddress(id=uuid.uuid4(), name="Home")
-        mock_session.scalar.return_value = existing
+        mock_session.scalar.side_effect = scalar_results
 
         with pytest.raises(HTTPException) as exc_info:
             await create_saved_address(data, citizen_user, mock_session)
 
         assert exc_info.value.status_code == 400
-        assert "already exists" in str(exc_info.value.detail)
-
-    async def test_create_saved_address_max_limit(self, mock_session, citizen_user):
-        """Should raise HTTPException when max addresses reached."""
-        data = SavedAddressCreate(
-            name="Work",
-            address="456 Office Blvd",
-            latitude=41.0082,
-            longitude=28.9784,
-            city="Istanbul",
-        )
-
-        # Mock: no duplicate, but at max count
-        mock_session.scalar.side_effect = [None, 10]  # No existing, count = 10
-
-        with pytest.raises(HTTPException) as exc_info:
-            await create_saved_address(data, citizen_user, mock_session)
-
-        assert exc_info.value.status_code == 400
-        assert "Maximum" in str(exc_info.value.detail)
+        assert detail in str(exc_info.value.detail)
 
 
 class TestGetSavedAddress:
     """Tests for get_saved_address endpoint."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = AsyncMock()
-        session.scalar = AsyncMock()
-        return session
-
     @pytest.fixture
     def citizen_user(self):
         """Create a mock citizen user."""
         return User(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             phone_number="+905551234567",
             name="Test Citizen",
             role=UserRole.CITIZEN,
@@ -203,8 +166,7 @@ class TestGetSavedAddress:
 
     async def test_get_saved_address_success(self, mock_session, citizen_user):
         """Should return a saved address."""
-        address_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        address_id = fake_uuid()
         address = SavedAddress(
             id=address_id,
             user_id=citizen_user.id,
@@ -213,8 +175,8 @@ class TestGetSavedAddress:
             latitude=41.0082,
             longitude=28.9784,
             city="Istanbul",
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
         mock_session.scalar.return_value = address
@@ -226,7 +188,7 @@ class TestGetSavedAddress:
 
     async def test_get_saved_address_not_found(self, mock_session, citizen_user):
         """Should raise HTTPException when address not found."""
-        address_id = uuid.uuid4()
+        address_id = fake_uuid()
         mock_session.scalar.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
@@ -238,20 +200,11 @@ class TestGetSavedAddress:
 class TestUpdateSavedAddress:
     """Tests for update_saved_address endpoint."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = AsyncMock()
-        session.scalar = AsyncMock()
-        session.commit = AsyncMock()
-        session.refresh = AsyncMock()
-        return session
-
     @pytest.fixture
     def citizen_user(self):
         """Create a mock citizen user."""
         return User(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             phone_number="+905551234567",
             name="Test Citizen",
             role=UserRole.CITIZEN,
@@ -259,8 +212,7 @@ class TestUpdateSavedAddress:
 
     async def test_update_saved_address_success(self, mock_session, citizen_user):
         """Should update a saved address."""
-        address_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        address_id = fake_uuid()
         address = SavedAddress(
             id=address_id,
             user_id=citizen_user.id,
@@ -269,14 +221,14 @@ class TestUpdateSavedAddress:
             latitude=41.0082,
             longitude=28.9784,
             city="Istanbul",
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
         # First call returns the address, second call returns None (no duplicate)
         mock_session.scalar.side_effect = [address, None]
 
-        data = SavedAddressUpdate(name="New Home")
+        data = SavedAddressUpdate.model_construct(name="New Home")
 
         result = await update_saved_address(
             address_id, data, citizen_user, mock_session
@@ -286,10 +238,10 @@ class TestUpdateSavedAddress:
 
     async def test_update_saved_address_not_found(self, mock_session, citizen_user):
         """Should raise HTTPException when address not found."""
-        address_id = uuid.uuid4()
+        address_id = fake_uuid()
         mock_session.scalar.return_value = None
 
-        data = SavedAddressUpdate(name="New Home")
+        data = SavedAddressUpdate.model_construct(name="New Home")
 
         with pytest.raises(HTTPException) as exc_info:
             await update_saved_address(address_id, data, citizen_user, mock_session)
@@ -300,20 +252,11 @@ class TestUpdateSavedAddress:
 class TestDeleteSavedAddress:
     """Tests for delete_saved_address endpoint."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = AsyncMock()
-        session.scalar = AsyncMock()
-        session.delete = AsyncMock()
-        session.commit = AsyncMock()
-        return session
-
     @pytest.fixture
     def citizen_user(self):
         """Create a mock citizen user."""
         return User(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             phone_number="+905551234567",
             name="Test Citizen",
             role=UserRole.CITIZEN,
@@ -321,7 +264,7 @@ class TestDeleteSavedAddress:
 
     async def test_delete_saved_address_success(self, mock_session, citizen_user):
         """Should delete a saved address."""
-        address_id = uuid.uuid4()
+        address_id = fake_uuid()
         address = SavedAddress(
             id=address_id,
             user_id=citizen_user.id,
@@ -337,7 +280,7 @@ class TestDeleteSavedAddress:
 
     async def test_delete_saved_address_not_found(self, mock_session, citizen_user):
         """Should raise HTTPException when address not found."""
-        address_id = uuid.uuid4()
+        address_id = fake_uuid()
         mock_session.scalar.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
@@ -1,7 +1,7 @@
 """Unit tests for analytics API endpoints."""
 
-import uuid
-from unittest.mock import AsyncMock, MagicMock
+from collections import namedtuple
+from dataclasses import dataclass
 
 import pytest
 
@@ -19,159 +19,133 @@ from app.models.user import User, UserRole
 from app.models.category import Category
 from app.models.team import Team
 from app.models.ticket import TicketStatus
+from tests.fixtures.factories import fake_uuid
+from tests.unit.api.conftest import fake_result
+
+# Fixed ids for mock rows; their values never matter, only their identity
+_TEAM_ID = fake_uuid()
+_CATEGORY_ID = fake_uuid()
+_MEMBER_ID = fake_uuid()
+_TICKET_IDS = tuple(fake_uuid() for _ in range(3))
+
+# Row shapes returned by the heatmap and neighborhood queries
+HeatmapRow = namedtuple("HeatmapRow", "latitude longitude count")
+NeighborhoodRow = namedtuple(
+    "NeighborhoodRow", "address district category_name ticket_id"
+)
 
 
-class TestGetDashboardKPIs:
-    """Tests for get_dashboard_kpis endpoint."""
-
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def support_user(self):
-        """Create a support user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Support",
-            role=UserRole.SUPPORT,
-        )
-
-    async def test_dashboard_kpis_with_data(self, mock_db, support_user):
-        """Should return dashboard KPIs with ticket data."""
-        # Mock total tickets count
-        mock_total = MagicMock()
-        mock_total.scalar.return_value = 100
-
-        # Mock status counts
-        mock_status = MagicMock()
-        mock_status.all.return_value = [
-            (TicketStatus.NEW, 20),
-            (TicketStatus.IN_PROGRESS, 30),
-            (TicketStatus.RESOLVED, 40),
-            (TicketStatus.CLOSED, 10),
-        ]
-
-        # Mock average rating
-        mock_rating = MagicMock()
-        mock_rating.scalar.return_value = 4.5
-
-        # Mock average resolution time
-        mock_resolution = MagicMock()
-        mock_resolution.scalar.return_value = 24.5
-
-        mock_db.execute.side_effect = [
-            mock_total,
-            mock_status,
-            mock_rating,
-            mock_resolution,
-        ]
-
-        result = await get_dashboard_kpis(mock_db, support_user, days=30)
+@dataclass(slots=True)
+class FeedbackStub:
+    """Feedback row; get_feedback_trends only reads the rating."""
 
-        assert result.total_tickets == 100
-        assert result.open_tickets == 50  # 20 + 30
-        assert result.resolved_tickets == 40
-        assert result.closed_tickets == 10
-        assert result.resolution_rate == 50.0  # (40+10)/100 * 100
+    rating: int
 
-    async def test_dashboard_kpis_empty_data(self, mock_db, support_user):
-        """Should return zeros when no tickets exist."""
-        mock_total = MagicMock()
-        mock_total.scalar.return_value = 0
 
-        mock_status = MagicMock()
-        mock_status.all.return_value = []
+# (status, count) rows for the dashboard status breakdown, 100 tickets total
+_DEFAULT_STATUS_ROWS = (
+    (TicketStatus.NEW, 20),
+    (TicketStatus.IN_PROGRESS, 30),
+    (TicketStatus.RESOLVED, 40),
+    (TicketStatus.CLOSED, 10),
+)
 
-        mock_rating = MagicMock()
-        mock_rating.scalar.return_value = None
 
-        mock_resolution = MagicMock()
-        mock_resolution.scalar.return_value = None
+class TestGetDashboardKPIs:
+    """Tests for get_dashboard_kpis endpoint."""
 
-        mock_db.execute.side_effect = [
-            mock_total,
-            mock_status,
-            mock_rating,
-            mock_resolution,
-        ]
+    @pytest.mark.parametrize(
+        "total,status_rows,rating,resolution_hours,expected",
+        [
+            (
+                100,
+                _DEFAULT_STATUS_ROWS,
+                4.5,
+                24.5,
+                {
+                    "total_tickets": 100,
+                    "open_tickets": 50,  # 20 + 30
+                    "resolved_tickets": 40,
+                    "closed_tickets": 10,
+                    "resolution_rate": 50.0,  # (40+10)/100 * 100
+                },
+            ),
+            (
+                0,
+                [],
+                None,
+                None,
+                {
+                    "total_tickets": 0,
+                    "resolution_rate": 0.0,
+                    "average_rating": None,
+                },
+            ),
+        ],
+        ids=["with_data", "empty"],
+    )
+    async def test_dashboard_kpis(
+        self,
+        mock_db,
+        support_user,
+        total,
+        status_rows,
+        rating,
+        resolution_hours,
+        expected,
+    ):
+        """Should aggregate ticket counts, or return zeros when none exist."""
+        mock_db.queue_many(
+            fake_result(scalar=total),
+            fake_result(rows=status_rows),
+            fake_result(scalar=rating),
+            fake_result(scalar=resolution_hours),
+        )
 
         result = await get_dashboard_kpis(mock_db, support_user, days=30)
 
-        assert result.total_tickets == 0
-        assert result.resolution_rate == 0.0
-        assert result.average_rating is None
+        for field, value in expected.items():
+            assert getattr(result, field) == value
 
 
 class TestGetTicketHeatmap:
     """Tests for get_ticket_heatmap endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def support_user(self):
-        """Create a support user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Support",
-            role=UserRole.SUPPORT,
-        )
-
-    async def test_heatmap_with_data(self, mock_db, support_user):
-        """Should return heatmap points with coordinates."""
+    @pytest.mark.parametrize(
+        "counts,expected_total,expected_max",
+        [([10, 5], 15, 10), ([], 0, 0)],
+        ids=["with_data", "empty"],
+    )
+    async def test_heatmap(
+        self, mock_db, support_user, counts, expected_total, expected_max
+    ):
+        """Should return heatmap points with coordinates, or none without tickets."""
         # Mock location/ticket data
-        mock_result = MagicMock()
-        mock_result.all.return_value = [
-            MagicMock(latitude=41.0082, longitude=28.9784, count=10),
-            MagicMock(latitude=41.0100, longitude=28.9800, count=5),
-        ]
-        mock_db.execute.return_value = mock_result
-
-        result = await get_ticket_heatmap(
-            mock_db, support_user, days=30, category_id=None, status=None
+        mock_db.queue(
+            fake_result(
+                rows=[
+                    HeatmapRow(41.0082 + i / 100, 28.9784, c)
+                    for i, c in enumerate(counts)
+                ]
+            )
         )
 
-        assert len(result.points) == 2
-        assert result.total_tickets == 15
-        assert result.max_count == 10
-        assert result.points[0].intensity == 1.0  # 10/10
-
-    async def test_heatmap_empty(self, mock_db, support_user):
-        """Should return empty heatmap when no tickets."""
-        mock_result = MagicMock()
-        mock_result.all.return_value = []
-        mock_db.execute.return_value = mock_result
-
         result = await get_ticket_heatmap(
             mock_db, support_user, days=30, category_id=None, status=None
         )
 
-        assert len(result.points) == 0
-        assert result.total_tickets == 0
-        assert result.max_count == 0
+        assert len(result.points) == len(counts)
+        assert result.total_tickets == expected_total
+        assert result.max_count == expected_max
+        if counts:
+            assert result.points[0].intensity == 1.0  # 10/10
 
     async def test_heatmap_with_category_filter(self, mock_db, support_user):
         """Should filter heatmap by category."""
-        category_id = uuid.uuid4()
-
-        mock_result = MagicMock()
-        mock_result.all.return_value = [
-            MagicMock(latitude=41.0082, longitude=28.9784, count=3),
-        ]
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(rows=[HeatmapRow(41.0082, 28.9784, 3)]))
 
         result = await get_ticket_heatmap(
-            mock_db, support_user, days=30, category_id=category_id, status=None
+            mock_db, support_user, days=30, category_id=_CATEGORY_ID, status=None
         )
 
         assert len(result.points) == 1
@@ -181,61 +155,24 @@ class TestGetTicketHeatmap:
 class TestGetTeamPerformance:
     """Tests for get_team_performance endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
-
     async def test_team_performance_with_teams(self, mock_db, manager_user):
         """Should return performance metrics for all teams."""
-        team = Team(id=uuid.uuid4(), name="Infrastructure Team")
-
-        # Mock teams query
-        mock_teams = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [team]
-        mock_teams.scalars.return_value = mock_scalars
-
-        # Mock member IDs query
-        mock_members = MagicMock()
-        mock_members.all.return_value = [(uuid.uuid4(),)]
-
-        # Mock total assigned
-        mock_assigned = MagicMock()
-        mock_assigned.scalar.return_value = 50
-
-        # Mock total resolved
-        mock_resolved = MagicMock()
-        mock_resolved.scalar.return_value = 40
-
-        # Mock avg resolution time
-        mock_avg_time = MagicMock()
-        mock_avg_time.scalar.return_value = 12.5
-
-        # Mock avg rating
-        mock_avg_rating = MagicMock()
-        mock_avg_rating.scalar.return_value = 4.2
-
-        mock_db.execute.side_effect = [
-            mock_teams,
-            mock_members,
-            mock_assigned,
-            mock_resolved,
-            mock_avg_time,
-            mock_avg_rating,
-        ]
+        team = Team(id=_TEAM_ID, name="Infrastructure Team")
+
+        mock_db.queue_many(
+            # Teams query
+            fake_result(scalars=[team]),
+            # Member IDs query
+            fake_result(rows=[(_MEMBER_ID,)]),
+            # Total assigned
+            fake_result(scalar=50),
+            # Total resolved
+            fake_result(scalar=40),
+            # Avg resolution time
+            fake_result(scalar=12.5),
+            # Avg rating
+            fake_result(scalar=4.2),
+        )
 
         result = await get_team_performance(mock_db, manager_user, days=30)
 
@@ -247,18 +184,13 @@ class TestGetTeamPerformance:
 
     async def test_team_performance_empty_team(self, mock_db, manager_user):
         """Should handle teams with no members."""
-        team = Team(id=uuid.uuid4(), name="Empty Team")
-
-        mock_teams = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [team]
-        mock_teams.scalars.return_value = mock_scalars
+        team = Team(id=_TEAM_ID, name="Empty Team")
 
-        # Empty members
-        mock_members = MagicMock()
-        mock_members.all.return_value = []
-
-        mock_db.execute.side_effect = [mock_teams, mock_members]
+        mock_db.queue_many(
+            fake_result(scalars=[team]),
+            # Empty members
+            fake_result(rows=[]),
+        )
 
         result = await get_team_performance(mock_db, manager_user, days=30)
 
@@ -270,142 +202,66 @@ class TestGetTeamPerformance:
 class TestGetTeamMemberPerformance:
     """Tests for get_team_member_performance endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
-
     async def test_member_performance_success(self, mock_db, manager_user):
         """Should return performance metrics for team members."""
-        team_id = uuid.uuid4()
-        team = Team(id=team_id, name="Test Team")
+        team = Team(id=_TEAM_ID, name="Test Team")
         member = User(
-            id=uuid.uuid4(),
+            id=_MEMBER_ID,
             phone_number="+905551111111",
             name="Support Member",
             role=UserRole.SUPPORT,
-            team_id=team_id,
+            team_id=_TEAM_ID,
         )
 
-        # Mock team lookup
-        mock_team = MagicMock()
-        mock_team.scalar_one_or_none.return_value = team
-
-        # Mock members query
-        mock_members = MagicMock()
-        mock_members_scalars = MagicMock()
-        mock_members_scalars.all.return_value = [member]
-        mock_members.scalars.return_value = mock_members_scalars
-
-        # Mock stats for member
-        mock_assigned = MagicMock()
-        mock_assigned.scalar.return_value = 20
-
-        mock_resolved = MagicMock()
-        mock_resolved.scalar.return_value = 18
-
-        mock_avg_time = MagicMock()
-        mock_avg_time.scalar.return_value = 8.5
-
-        mock_avg_rating = MagicMock()
-        mock_avg_rating.scalar.return_value = 4.8
-
-        mock_db.execute.side_effect = [
-            mock_team,
-            mock_members,
-            mock_assigned,
-            mock_resolved,
-            mock_avg_time,
-            mock_avg_rating,
-        ]
+        mock_db.queue_many(
+            # Team lookup
+            fake_result(scalar_one_or_none=team),
+            # Members query
+            fake_result(scalars=[member]),
+            # Stats for member
+            fake_result(scalar=20),
+            fake_result(scalar=18),
+            fake_result(scalar=8.5),
+            fake_result(scalar=4.8),
+        )
 
         result = await get_team_member_performance(
-            team_id, mock_db, manager_user, days=30
+            _TEAM_ID, mock_db, manager_user, days=30
         )
 
-        assert result.team_id == team_id
+        assert result.team_id == _TEAM_ID
         assert result.team_name == "Test Team"
         assert len(result.members) == 1
         assert result.members[0].user_name == "Support Member"
 
     async def test_member_performance_team_not_found(self, mock_db, manager_user):
         """Should raise NotFoundException for non-existent team."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
         with pytest.raises(NotFoundException):
-            await get_team_member_performance(
-                uuid.uuid4(), mock_db, manager_user, days=30
-            )
+            await get_team_member_performance(_TEAM_ID, mock_db, manager_user, days=30)
 
 
 class TestGetCategoryStatistics:
     """Tests for get_category_statistics endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
-
     async def test_category_stats_success(self, mock_db, manager_user):
         """Should return statistics for all categories."""
         category = Category(
-            id=uuid.uuid4(),
+            id=_CATEGORY_ID,
             name="Infrastructure",
             is_active=True,
         )
 
-        # Mock categories query
-        mock_categories = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [category]
-        mock_categories.scalars.return_value = mock_scalars
-
-        # Mock category stats
-        mock_total = MagicMock()
-        mock_total.scalar.return_value = 30
-
-        mock_open = MagicMock()
-        mock_open.scalar.return_value = 10
-
-        mock_resolved = MagicMock()
-        mock_resolved.scalar.return_value = 20
-
-        mock_rating = MagicMock()
-        mock_rating.scalar.return_value = 4.3
-
-        mock_db.execute.side_effect = [
-            mock_categories,
-            mock_total,
-            mock_open,
-            mock_resolved,
-            mock_rating,
-        ]
+        mock_db.queue_many(
+            # Categories query
+            fake_result(scalars=[category]),
+            # Category stats: total, open, resolved, rating
+            fake_result(scalar=30),
+            fake_result(scalar=10),
+            fake_result(scalar=20),
+            fake_result(scalar=4.3),
+        )
 
         result = await get_category_statistics(mock_db, manager_user, days=30)
 
@@ -419,132 +275,74 @@ class TestGetCategoryStatistics:
 class TestGetNeighborhoodStatistics:
     """Tests for get_neighborhood_statistics endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
-
-    async def test_neighborhood_stats_success(self, mock_db, manager_user):
-        """Should return neighborhood statistics."""
-        # Mock ticket data with locations
-        mock_result = MagicMock()
-        mock_result.all.return_value = [
-            ("Beyoğlu Address", "Beyoğlu", "Infrastructure", uuid.uuid4()),
-            ("Beyoğlu Address 2", "Beyoğlu", "Traffic", uuid.uuid4()),
-            ("Kadıköy Address", "Kadıköy", "Lighting", uuid.uuid4()),
-        ]
-        mock_db.execute.return_value = mock_result
-
-        result = await get_neighborhood_statistics(
-            mock_db, manager_user, days=30, limit=5
-        )
-
-        assert len(result.items) <= 5
-        # Should have Beyoğlu with 2 tickets and Kadıköy with 1
-
-    async def test_neighborhood_stats_empty(self, mock_db, manager_user):
-        """Should return empty list when no tickets."""
-        mock_result = MagicMock()
-        mock_result.all.return_value = []
-        mock_db.execute.return_value = mock_result
+    @pytest.mark.parametrize(
+        "rows,expected_items",
+        [
+            (
+                [
+                    NeighborhoodRow(
+                        "Beyoğlu Address", "Beyoğlu", "Infrastructure", _TICKET_IDS[0]
+                    ),
+                    NeighborhoodRow(
+                        "Beyoğlu Address 2", "Beyoğlu", "Traffic", _TICKET_IDS[1]
+                    ),
+                    NeighborhoodRow(
+                        "Kadıköy Address", "Kadıköy", "Lighting", _TICKET_IDS[2]
+                    ),
+                ],
+                2,  # Beyoğlu with 2 tickets and Kadıköy with 1
+            ),
+            ([], 0),
+        ],
+        ids=["with_data", "empty"],
+    )
+    async def test_neighborhood_stats(
+        self, mock_db, manager_user, rows, expected_items
+    ):
+        """Should group tickets by neighborhood, or return an empty list."""
+        mock_db.queue(fake_result(rows=rows))
 
         result = await get_neighborhood_statistics(
             mock_db, manager_user, days=30, limit=5
         )
 
-        assert len(result.items) == 0
+        assert len(result.items) == expected_items
 
 
 class TestGetFeedbackTrends:
     """Tests for get_feedback_trends endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
-
-    async def test_feedback_trends_with_data(self, mock_db, manager_user):
+    @pytest.mark.parametrize(
+        "ratings,expected_average",
+        [
+            ([5, 4, 5], 4.67),  # (5+4+5)/3
+            ([], None),  # Categories with no feedback are skipped
+        ],
+        ids=["with_data", "no_feedback"],
+    )
+    async def test_feedback_trends(
+        self, mock_db, manager_user, ratings, expected_average
+    ):
         """Should return feedback trends by category."""
-
         category = Category(
-            id=uuid.uuid4(),
+            id=_CATEGORY_ID,
             name="Infrastructure",
             is_active=True,
         )
 
-        # Create mock feedbacks
-        feedback1 = MagicMock()
-        feedback1.rating = 5
-        feedback2 = MagicMock()
-        feedback2.rating = 4
-        feedback3 = MagicMock()
-        feedback3.rating = 5
-
-        # Mock categories query
-        mock_categories = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [category]
-        mock_categories.scalars.return_value = mock_scalars
-
-        # Mock feedbacks query
-        mock_feedbacks = MagicMock()
-        mock_feedbacks_scalars = MagicMock()
-        mock_feedbacks_scalars.all.return_value = [feedback1, feedback2, feedback3]
-        mock_feedbacks.scalars.return_value = mock_feedbacks_scalars
-
-        mock_db.execute.side_effect = [mock_categories, mock_feedbacks]
-
-        result = await get_feedback_trends(mock_db, manager_user, days=30)
-
-        assert len(result.items) == 1
-        assert result.items[0].category_name == "Infrastructure"
-        assert result.items[0].total_feedbacks == 3
-        assert result.items[0].average_rating == 4.67  # (5+4+5)/3
-
-    async def test_feedback_trends_no_feedback(self, mock_db, manager_user):
-        """Should skip categories with no feedback."""
-        category = Category(
-            id=uuid.uuid4(),
-            name="Empty Category",
-            is_active=True,
+        mock_db.queue_many(
+            # Categories query
+            fake_result(scalars=[category]),
+            # Feedbacks query
+            fake_result(scalars=[FeedbackStub(r) for r in ratings]),
         )
 
-        mock_categories = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [category]
-        mock_categories.scalars.return_value = mock_scalars
-
-        mock_feedbacks = MagicMock()
-        mock_feedbacks_scalars = MagicMock()
-        mock_feedbacks_scalars.all.return_value = []
-        mock_feedbacks.scalars.return_value = mock_feedbacks_scalars
-
-        mock_db.execute.side_effect = [mock_categories, mock_feedbacks]
-
         result = await get_feedback_trends(mock_db, manager_user, days=30)
 
-        assert len(result.items) == 0
+        if expected_average is None:
+            assert len(result.items) == 0
+        else:
+            assert len(result.items) == 1
+            assert result.items[0].category_name == "Infrastructure"
+            assert result.items[0].total_feedbacks == len(ratings)
+            assert result.items[0].average_rating == expected_average
@@ -1,7 +1,8 @@
 """Unit tests for authentication API endpoints."""
 
-import uuid
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -24,7 +25,7 @@ from app.core.exceptions import (
     UserNotVerifiedException,
     NotStaffException,
 )
-from app.models.user import User, UserRole, OTPCode
+from app.models.user import UserRole
 from app.schemas.auth import (
     RequestOTPRequest,
     VerifyOTPRequest,
@@ -33,499 +34,387 @@ from app.schemas.auth import (
     StaffLoginRequest,
     RefreshTokenRequest,
 )
+from tests.fixtures.factories import NOW, fake_uuid
+from tests.unit.api.conftest import fake_result
+
+# Shared across tests and reset by _reset_shared_mocks.
+_check_rate_limit = AsyncMock()
+_issue_tokens = {
+    "create_access_token": MagicMock(return_value="access_token"),
+    "create_refresh_token": MagicMock(return_value="refresh_token"),
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks():
+    """Clear call history on the module-level mocks before each test."""
+    _check_rate_limit.reset_mock()
+    for mock in _issue_tokens.values():
+        mock.reset_mock()
+
+
+def _fake_user(**attrs: Any) -> SimpleNamespace:
+    """Stand-in for a ``User`` row returned from a mocked query."""
+    return SimpleNamespace(**{"id": fake_uuid(), "password_changed_at": None, **attrs})
+
+
+def _fake_otp(**attrs: Any) -> SimpleNamespace:
+    """Stand-in for an ``OTPCode`` row returned from a mocked query."""
+    return SimpleNamespace(**{"id": fake_uuid(), "is_used": False, **attrs})
+
+
+async def _assert_login_rejected(
+    endpoint, request_cls, user, exc, mock_db, mock_request, *, password_ok
+):
+    """Call a login endpoint whose user lookup returns ``user``; expect ``exc``."""
+    login_request = request_cls.model_construct(
+        email="test@example.com",
+        password="SecurePass123!",
+    )
+    mock_db.queue(fake_result(scalar_one_or_none=user))
+
+    with (
+        patch("app.api.v1.auth.check_rate_limit", new=_check_rate_limit),
+        patch(
+            "app.api.v1.auth.verify_password",
+            new=MagicMock(return_value=password_ok),
+        ),
+        pytest.raises(exc),
+    ):
+        await endpoint(login_request, mock_db, mock_request)
 
 
 class TestRequestOTP:
     """Tests for request_otp endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def mock_request(self):
-        """Create a mock FastAPI request."""
-        request = MagicMock()
-        request.client = MagicMock()
-        request.client.host = "127.0.0.1"
-        return request
-
+    @patch("app.api.v1.auth.check_rate_limit", new=_check_rate_limit)
     async def test_request_otp_for_new_phone(self, mock_db, mock_request):
         """Should generate OTP for new phone number."""
-        otp_request = RequestOTPRequest(phone_number="+905551234567")
+        otp_request = RequestOTPRequest.model_construct(phone_number="+905551234567")
 
         # Mock: no existing verified user
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with patch("app.api.v1.auth.sms_service") as mock_sms:
-                mock_sms.send_otp = AsyncMock(return_value=True)
+        with patch("app.api.v1.auth.sms_service") as mock_sms:
+            mock_sms.send_otp = AsyncMock(return_value=True)
 
-                result = await request_otp(otp_request, mock_db, mock_request)
+            result = await request_otp(otp_request, mock_db, mock_request)
 
-                assert result.message == "OTP code sent successfully"
-                assert result.expires_in_seconds == 300
+            assert result.message == "OTP code sent successfully"
+            assert result.expires_in_seconds == 300
 
+    @patch("app.api.v1.auth.check_rate_limit", new=_check_rate_limit)
     async def test_request_otp_for_existing_verified_user(self, mock_db, mock_request):
         """Should raise UserAlreadyExistsException for verified user."""
-        otp_request = RequestOTPRequest(phone_number="+905551234567")
+        otp_request = RequestOTPRequest.model_construct(phone_number="+905551234567")
 
         # Mock: existing verified user
-        existing_user = User(
-            id=uuid.uuid4(),
+        existing_user = _fake_user(
             phone_number="+905551234567",
             is_verified=True,
         )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = existing_user
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=existing_user))
 
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with pytest.raises(UserAlreadyExistsException):
-                await request_otp(otp_request, mock_db, mock_request)
+        with pytest.raises(UserAlreadyExistsException):
+            await request_otp(otp_request, mock_db, mock_request)
 
 
 class TestVerifyOTP:
     """Tests for verify_otp endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
+    @patch.multiple("app.api.v1.auth", **_issue_tokens)
     async def test_verify_valid_otp_new_user(self, mock_db):
         """Should create new user and return tokens for valid OTP."""
-        verify_request = VerifyOTPRequest(phone_number="+905551234567", code="123456")
+        verify_request = VerifyOTPRequest.model_construct(
+            phone_number="+905551234567", code="123456"
+        )
 
         # Mock: valid OTP
-        valid_otp = OTPCode(
-            id=uuid.uuid4(),
+        valid_otp = _fake_otp(
             phone_number="+905551234567",
             code="123456",
+            # verify_otp compares against the wall clock, so this stays relative.
             expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
             is_used=False,
         )
 
         # First call returns OTP, second returns None (no existing user)
-        mock_result1 = MagicMock()
-        mock_result1.scalar_one_or_none.return_value = valid_otp
-        mock_result2 = MagicMock()
-        mock_result2.scalar_one_or_none.return_value = None
-
-        mock_db.execute.side_effect = [mock_result1, mock_result2]
-
-        with patch("app.api.v1.auth.create_access_token") as mock_access:
-            with patch("app.api.v1.auth.create_refresh_token") as mock_refresh:
-                mock_access.return_value = "access_token"
-                mock_refresh.return_value = "refresh_token"
-
-                result = await verify_otp(verify_request, mock_db)
-
-                assert result.access_token == "access_token"
-                assert result.refresh_token == "refresh_token"
-                assert result.token_type == "bearer"
-                mock_db.add.assert_called()
-
-    async def test_verify_otp_invalid_code(self, mock_db):
-        """Should raise OTPInvalidException for wrong code."""
-        verify_request = VerifyOTPRequest(phone_number="+905551234567", code="000000")
-
-        # Mock: no OTP found
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        with pytest.raises(OTPInvalidException):
-            await verify_otp(verify_request, mock_db)
-
-    async def test_verify_otp_expired(self, mock_db):
-        """Should raise OTPExpiredException for expired OTP."""
-        verify_request = VerifyOTPRequest(phone_number="+905551234567", code="123456")
+        mock_db.queue_many(
+            fake_result(scalar_one_or_none=valid_otp),
+            fake_result(scalar_one_or_none=None),
+        )
 
-        # Mock: expired OTP
-        expired_otp = OTPCode(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            code="123456",
-            expires_at=datetime.now(timezone.utc) - timedelta(minutes=5),
-            is_used=False,
+        result = await verify_otp(verify_request, mock_db)
+
+        assert result.access_token == "access_token"
+        assert result.refresh_token == "refresh_token"
+        assert result.token_type == "bearer"
+        mock_db.add.assert_called()
+
+    @pytest.mark.parametrize(
+        "otp,exc",
+        [
+            pytest.param(None, OTPInvalidException, id="invalid_code"),
+            pytest.param(
+                _fake_otp(
+                    phone_number="+905551234567",
+                    code="123456",
+                    expires_at=NOW - timedelta(minutes=5),
+                    is_used=False,
+                ),
+                OTPExpiredException,
+                id="expired",
+            ),
+        ],
+    )
+    async def test_verify_otp_rejected(self, mock_db, otp, exc):
+        """Should reject unknown and expired OTP codes."""
+        verify_request = VerifyOTPRequest.model_construct(
+            phone_number="+905551234567", code="123456"
         )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = expired_otp
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=otp))
 
-        with pytest.raises(OTPExpiredException):
+        with pytest.raises(exc):
             await verify_otp(verify_request, mock_db)
 
 
 class TestRegister:
     """Tests for register endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def mock_request(self):
-        """Create a mock FastAPI request."""
-        request = MagicMock()
-        request.client = MagicMock()
-        request.client.host = "127.0.0.1"
-        return request
-
+    @patch.multiple(
+        "app.api.v1.auth",
+        check_rate_limit=_check_rate_limit,
+        hash_password=MagicMock(return_value="hashed_password"),
+        email_service=MagicMock(send_verification_email=AsyncMock()),
+    )
     async def test_register_success(self, mock_db, mock_request):
         """Should create user and return verification message on successful registration."""
-        register_request = RegisterRequest(
+        register_request = RegisterRequest.model_construct(
             phone_number="+905551234567",
             email="test@example.com",
             password="SecurePass123!",
             full_name="Test User",
         )
 
-        # Mock: no existing users
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with patch("app.api.v1.auth.hash_password") as mock_hash:
-                with patch("app.api.v1.auth.email_service") as mock_email_service:
-                    mock_hash.return_value = "hashed_password"
-                    mock_email_service.send_verification_email = AsyncMock()
-
-                    result = await register(register_request, mock_db, mock_request)
-
-                    # New behavior: returns message instead of tokens (email verification required)
-                    assert "message" in result.model_dump()
-                    mock_db.add.assert_called()
-
-    async def test_register_phone_already_exists(self, mock_db, mock_request):
-        """Should raise UserAlreadyExistsException for existing phone."""
-        register_request = RegisterRequest(
-            phone_number="+905551234567",
-            email="test@example.com",
-            password="SecurePass123!",
-            full_name="Test User",
+        # Mock: no existing users (phone lookup, then email lookup)
+        mock_db.queue_many(
+            fake_result(scalar_one_or_none=None),
+            fake_result(scalar_one_or_none=None),
         )
 
-        # Mock: existing user with phone
-        existing_user = User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-        )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = existing_user
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with pytest.raises(UserAlreadyExistsException):
-                await register(register_request, mock_db, mock_request)
-
-    async def test_register_email_already_exists(self, mock_db, mock_request):
-        """Should raise EmailAlreadyExistsException for existing email."""
-        register_request = RegisterRequest(
+        result = await register(register_request, mock_db, mock_request)
+
+        # New behavior: returns message instead of tokens (email verification required)
+        assert "message" in result.model_dump()
+        mock_db.add.assert_called()
+
+    @pytest.mark.parametrize(
+        "lookups,exc",
+        [
+            pytest.param(
+                [_fake_user(phone_number="+905551234567")],
+                UserAlreadyExistsException,
+                id="phone_exists",
+            ),
+            pytest.param(
+                [None, _fake_user(email="test@example.com")],
+                EmailAlreadyExistsException,
+                id="email_exists",
+            ),
+        ],
+    )
+    @patch("app.api.v1.auth.check_rate_limit", new=_check_rate_limit)
+    async def test_register_conflict(self, mock_db, mock_request, lookups, exc):
+        """Should reject a phone number or email that is already registered."""
+        register_request = RegisterRequest.model_construct(
             phone_number="+905551234567",
             email="test@example.com",
             password="SecurePass123!",
             full_name="Test User",
         )
-
-        # First call: no user with phone, second call: user with email
-        mock_result1 = MagicMock()
-        mock_result1.scalar_one_or_none.return_value = None
-        mock_result2 = MagicMock()
-        mock_result2.scalar_one_or_none.return_value = User(
-            id=uuid.uuid4(),
-            email="test@example.com",
+        mock_db.queue_many(
+            *(fake_result(scalar_one_or_none=found) for found in lookups)
         )
-        mock_db.execute.side_effect = [mock_result1, mock_result2]
 
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with pytest.raises(EmailAlreadyExistsException):
-                await register(register_request, mock_db, mock_request)
+        with pytest.raises(exc):
+            await register(register_request, mock_db, mock_request)
 
 
 class TestLogin:
     """Tests for login endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def mock_request(self):
-        """Create a mock FastAPI request."""
-        request = MagicMock()
-        request.client = MagicMock()
-        request.client.host = "127.0.0.1"
-        return request
-
+    @patch.multiple(
+        "app.api.v1.auth",
+        check_rate_limit=_check_rate_limit,
+        verify_password=MagicMock(return_value=True),
+        **_issue_tokens,
+    )
     async def test_login_success(self, mock_db, mock_request):
         """Should return tokens on successful login."""
-        login_request = LoginRequest(
+        login_request = LoginRequest.model_construct(
             email="test@example.com",
             password="SecurePass123!",
         )
 
-        verified_user = User(
-            id=uuid.uuid4(),
+        verified_user = _fake_user(
             email="test@example.com",
             password_hash="hashed_password",
             is_verified=True,
             is_active=True,
         )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = verified_user
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with patch("app.api.v1.auth.verify_password") as mock_verify:
-                with patch("app.api.v1.auth.create_access_token") as mock_access:
-                    with patch("app.api.v1.auth.create_refresh_token") as mock_refresh:
-                        mock_verify.return_value = True
-                        mock_access.return_value = "access_token"
-                        mock_refresh.return_value = "refresh_token"
-
-                        result = await login(login_request, mock_db, mock_request)
-
-                        assert result.access_token == "access_token"
-                        assert result.token_type == "bearer"
-
-    async def test_login_invalid_credentials(self, mock_db, mock_request):
-        """Should raise InvalidCredentialsException for wrong credentials."""
-        login_request = LoginRequest(
-            email="test@example.com",
-            password="WrongPassword",
-        )
-
-        # Mock: no user found
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with pytest.raises(InvalidCredentialsException):
-                await login(login_request, mock_db, mock_request)
-
-    async def test_login_wrong_password(self, mock_db, mock_request):
-        """Should raise InvalidCredentialsException for wrong password."""
-        login_request = LoginRequest(
-            email="test@example.com",
-            password="WrongPassword",
-        )
-
-        user = User(
-            id=uuid.uuid4(),
-            email="test@example.com",
-            password_hash="hashed_password",
-            is_verified=True,
-        )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = user
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with patch("app.api.v1.auth.verify_password") as mock_verify:
-                mock_verify.return_value = False
-
-                with pytest.raises(InvalidCredentialsException):
-                    await login(login_request, mock_db, mock_request)
-
-    async def test_login_unverified_user(self, mock_db, mock_request):
-        """Should raise UserNotVerifiedException for unverified user."""
-        login_request = LoginRequest(
-            email="test@example.com",
-            password="SecurePass123!",
-        )
-
-        unverified_user = User(
-            id=uuid.uuid4(),
-            email="test@example.com",
-            password_hash="hashed_password",
-            is_verified=False,
+        mock_db.queue(fake_result(scalar_one_or_none=verified_user))
+
+        result = await login(login_request, mock_db, mock_request)
+
+        assert result.access_token == "access_token"
+        assert result.token_type == "bearer"
+
+    @pytest.mark.parametrize(
+        "user,exc",
+        [
+            pytest.param(None, InvalidCredentialsException, id="unknown_email"),
+            pytest.param(
+                _fake_user(
+                    email="test@example.com",
+                    password_hash="hashed_password",
+                    is_verified=True,
+                ),
+                InvalidCredentialsException,
+                id="wrong_password",
+            ),
+            pytest.param(
+                _fake_user(
+                    email="test@example.com",
+                    password_hash="hashed_password",
+                    is_verified=False,
+                ),
+                UserNotVerifiedException,
+                id="unverified",
+            ),
+        ],
+    )
+    async def test_login_rejected(self, mock_db, mock_request, user, exc):
+        """Should reject unknown, unverified or wrong-password logins."""
+        await _assert_login_rejected(
+            login, LoginRequest, user, exc, mock_db, mock_request, password_ok=False
         )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = unverified_user
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with pytest.raises(UserNotVerifiedException):
-                await login(login_request, mock_db, mock_request)
 
 
 class TestStaffLogin:
     """Tests for staff_login endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def mock_request(self):
-        """Create a mock FastAPI request."""
-        request = MagicMock()
-        request.client = MagicMock()
-        request.client.host = "127.0.0.1"
-        return request
-
+    @patch.multiple(
+        "app.api.v1.auth",
+        check_rate_limit=_check_rate_limit,
+        verify_password=MagicMock(return_value=True),
+        **_issue_tokens,
+    )
     async def test_staff_login_success(self, mock_db, mock_request):
         """Should return tokens for staff user."""
-        login_request = StaffLoginRequest(
+        login_request = StaffLoginRequest.model_construct(
             email="support@example.com",
             password="SecurePass123!",
         )
 
-        support_user = User(
-            id=uuid.uuid4(),
+        support_user = _fake_user(
             email="support@example.com",
             password_hash="hashed_password",
             role=UserRole.SUPPORT,
             is_verified=True,
             is_active=True,
         )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = support_user
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with patch("app.api.v1.auth.verify_password") as mock_verify:
-                with patch("app.api.v1.auth.create_access_token") as mock_access:
-                    with patch("app.api.v1.auth.create_refresh_token") as mock_refresh:
-                        mock_verify.return_value = True
-                        mock_access.return_value = "access_token"
-                        mock_refresh.return_value = "refresh_token"
-
-                        result = await staff_login(login_request, mock_db, mock_request)
-
-                        assert result.access_token == "access_token"
-
-    async def test_staff_login_citizen_rejected(self, mock_db, mock_request):
-        """Should raise NotStaffException for citizen users."""
-        login_request = StaffLoginRequest(
-            email="citizen@example.com",
-            password="SecurePass123!",
-        )
-
-        citizen_user = User(
-            id=uuid.uuid4(),
-            email="citizen@example.com",
-            password_hash="hashed_password",
-            role=UserRole.CITIZEN,
-            is_verified=True,
+        mock_db.queue(fake_result(scalar_one_or_none=support_user))
+
+        result = await staff_login(login_request, mock_db, mock_request)
+
+        assert result.access_token == "access_token"
+
+    @pytest.mark.parametrize(
+        "user,exc",
+        [
+            pytest.param(
+                _fake_user(
+                    email="citizen@example.com",
+                    password_hash="hashed_password",
+                    role=UserRole.CITIZEN,
+                    is_verified=True,
+                ),
+                NotStaffException,
+                id="citizen",
+            ),
+            pytest.param(
+                _fake_user(
+                    email="support@example.com",
+                    password_hash="hashed_password",
+                    role=UserRole.SUPPORT,
+                    is_verified=False,
+                ),
+                UserNotVerifiedException,
+                id="unverified",
+            ),
+        ],
+    )
+    async def test_staff_login_rejected(self, mock_db, mock_request, user, exc):
+        """Should reject citizens and unverified staff."""
+        await _assert_login_rejected(
+            staff_login,
+            StaffLoginRequest,
+            user,
+            exc,
+            mock_db,
+            mock_request,
+            password_ok=True,
         )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = citizen_user
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with patch("app.api.v1.auth.verify_password") as mock_verify:
-                mock_verify.return_value = True
-
-                with pytest.raises(NotStaffException):
-                    await staff_login(login_request, mock_db, mock_request)
-
-    async def test_staff_login_unverified(self, mock_db, mock_request):
-        """Should raise UserNotVerifiedException for unverified staff."""
-        login_request = StaffLoginRequest(
-            email="support@example.com",
-            password="SecurePass123!",
-        )
-
-        unverified_staff = User(
-            id=uuid.uuid4(),
-            email="support@example.com",
-            password_hash="hashed_password",
-            role=UserRole.SUPPORT,
-            is_verified=False,
-        )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = unverified_staff
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.check_rate_limit", new_callable=AsyncMock):
-            with pytest.raises(UserNotVerifiedException):
-                await staff_login(login_request, mock_db, mock_request)
 
 
 class TestRefreshToken:
     """Tests for refresh_token endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
     async def test_refresh_token_success(self, mock_db):
         """Should return new tokens for valid refresh token."""
-        user_id = uuid.uuid4()
-        refresh_request = RefreshTokenRequest(refresh_token="valid_refresh_token")
+        user_id = fake_uuid()
+        refresh_request = RefreshTokenRequest.model_construct(
+            refresh_token="valid_refresh_token"
+        )
 
-        user = User(
+        user = _fake_user(
             id=user_id,
             phone_number="+905551234567",
             is_active=True,
         )
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = user
-        mock_db.execute.return_value = mock_result
-
-        with patch("app.api.v1.auth.decode_token") as mock_decode:
-            with patch("app.api.v1.auth.create_access_token") as mock_access:
-                with patch("app.api.v1.auth.create_refresh_token") as mock_refresh:
-                    mock_decode.return_value = {"sub": str(user_id), "type": "refresh"}
-                    mock_access.return_value = "new_access_token"
-                    mock_refresh.return_value = "new_refresh_token"
-
-                    result = await refresh_token(refresh_request, mock_db)
-
-                    assert result.access_token == "new_access_token"
-                    assert result.token_type == "bearer"
-
-    async def test_refresh_token_invalid(self, mock_db):
-        """Should raise OTPInvalidException for invalid refresh token."""
-        refresh_request = RefreshTokenRequest(refresh_token="invalid_token")
-
-        with patch("app.api.v1.auth.decode_token") as mock_decode:
-            mock_decode.return_value = None
-
-            with pytest.raises(OTPInvalidException):
-                await refresh_token(refresh_request, mock_db)
-
-    async def test_refresh_token_wrong_type(self, mock_db):
-        """Should raise OTPInvalidException for access token used as refresh."""
-        refresh_request = RefreshTokenRequest(refresh_token="access_token")
-
-        with patch("app.api.v1.auth.decode_token") as mock_decode:
-            mock_decode.return_value = {"sub": str(uuid.uuid4()), "type": "access"}
+        mock_db.queue(fake_result(scalar_one_or_none=user))
+
+        with patch.multiple(
+            "app.api.v1.auth",
+            decode_token=MagicMock(
+                return_value={"sub": str(user_id), "type": "refresh"}
+            ),
+            create_access_token=MagicMock(return_value="new_access_token"),
+            create_refresh_token=MagicMock(return_value="new_refresh_token"),
+        ):
+            result = await refresh_token(refresh_request, mock_db)
+
+        assert result.access_token == "new_access_token"
+        assert result.token_type == "bearer"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(None, id="invalid"),
+            pytest.param({"sub": str(fake_uuid()), "type": "access"}, id="wrong_type"),
+        ],
+    )
+    async def test_refresh_token_rejected(self, mock_db, payload):
+        """Should raise OTPInvalidException for bad or non-refresh tokens."""
+        refresh_request = RefreshTokenRequest.model_construct(
+            refresh_token="some_token"
+        )
 
-            with pytest.raises(OTPInvalidException):
-                await refresh_token(refresh_request, mock_db)
+        with (
+            patch("app.api.v1.auth.decode_token", new=MagicMock(return_value=payload)),
+            pytest.raises(OTPInvalidException),
+        ):
+            await refresh_token(refresh_request, mock_db)
 
 
 class TestGetCurrentUserInfo:
@@ -533,17 +422,15 @@ class TestGetCurrentUserInfo:
 
     async def test_returns_user_info(self):
         """Should return current user's information."""
-        now = datetime.now(timezone.utc)
-        user = User(
-            id=uuid.uuid4(),
+        user = _fake_user(
             phone_number="+905551234567",
             name="Test User",
             email="test@example.com",
             role=UserRole.CITIZEN,
             is_verified=True,
             is_active=True,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
         result = await get_current_user_info(user)
@@ -1,9 +1,5 @@
 """Unit tests for categories API endpoints."""
 
-import uuid
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from app.api.v1.categories import (
@@ -14,47 +10,36 @@ from app.api.v1.categories import (
 )
 from app.core.exceptions import CategoryNotFoundException, ConflictException
 from app.models.category import Category
-from app.models.user import User, UserRole
 from app.schemas.category import CategoryCreate, CategoryUpdate
+from tests.fixtures.factories import NOW, fake_uuid
+from tests.unit.api.conftest import fake_result, populate_on_refresh
 
 
 class TestListCategories:
     """Tests for list_categories endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
     async def test_list_categories_active_only(self, mock_db):
         """Should return only active categories by default."""
-        now = datetime.now(timezone.utc)
         categories = [
             Category(
-                id=uuid.uuid4(),
+                id=fake_uuid(),
                 name="Roads",
                 description="Road issues",
                 is_active=True,
-                created_at=now,
-                updated_at=now,
+                created_at=NOW,
+                updated_at=NOW,
             ),
             Category(
-                id=uuid.uuid4(),
+                id=fake_uuid(),
                 name="Parks",
                 description="Park issues",
                 is_active=True,
-                created_at=now,
-                updated_at=now,
+                created_at=NOW,
+                updated_at=NOW,
             ),
         ]
 
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = categories
-        mock_result.scalars.return_value = mock_scalars
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalars=categories))
 
         result = await list_categories(mock_db, active_only=True)
 
@@ -63,29 +48,24 @@ class TestListCategories:
 
     async def test_list_categories_include_inactive(self, mock_db):
         """Should return all categories when active_only=False."""
-        now = datetime.now(timezone.utc)
         categories = [
             Category(
-                id=uuid.uuid4(),
+                id=fake_uuid(),
                 name="Roads",
                 is_active=True,
-                created_at=now,
-                updated_at=now,
+                created_at=NOW,
+                updated_at=NOW,
             ),
             Category(
-                id=uuid.uuid4(),
+                id=fake_uuid(),
                 name="Deprecated",
                 is_active=False,
-                created_at=now,
-                updated_at=now,
+                created_at=NOW,
+                updated_at=NOW,
             ),
         ]
 
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = categories
-        mock_result.scalars.return_value = mock_scalars
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalars=categories))
 
         result = await list_categories(mock_db, active_only=False)
 
@@ -95,29 +75,19 @@ class TestListCategories:
 class TestGetCategory:
     """Tests for get_category endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
     async def test_get_category_success(self, mock_db):
         """Should return a category by ID."""
-        category_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        category_id = fake_uuid()
         category = Category(
             id=category_id,
             name="Roads",
             description="Road issues",
             is_active=True,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = category
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=category))
 
         result = await get_category(category_id, mock_db)
 
@@ -126,11 +96,9 @@ class TestGetCategory:
 
     async def test_get_category_not_found(self, mock_db):
         """Should raise CategoryNotFoundException when not found."""
-        category_id = uuid.uuid4()
+        category_id = fake_uuid()
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
         with pytest.raises(CategoryNotFoundException):
             await get_category(category_id, mock_db)
@@ -139,40 +107,17 @@ class TestGetCategory:
 class TestCreateCategory:
     """Tests for create_category endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a mock manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-            is_verified=True,
-        )
-
     async def test_create_category_success(self, mock_db, manager_user):
         """Should create a new category."""
-        request = CategoryCreate(name="New Category", description="Description")
+        request = CategoryCreate.model_construct(
+            name="New Category", description="Description"
+        )
 
         # Mock: no existing category
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
         async def mock_refresh(cat):
-            cat.id = uuid.uuid4()
-            cat.created_at = datetime.now(timezone.utc)
-            cat.updated_at = datetime.now(timezone.utc)
+            await populate_on_refresh(cat)
             cat.is_active = True
 
         mock_db.refresh = mock_refresh
@@ -184,13 +129,13 @@ class TestCreateCategory:
 
     async def test_create_category_duplicate_name(self, mock_db, manager_user):
         """Should raise ConflictException for duplicate name."""
-        request = CategoryCreate(name="Roads", description="Description")
+        request = CategoryCreate.model_construct(
+            name="Roads", description="Description"
+        )
 
         # Mock: existing category
-        existing = Category(id=uuid.uuid4(), name="Roads")
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = existing
-        mock_db.execute.return_value = mock_result
+        existing = Category(id=fake_uuid(), name="Roads")
+        mock_db.queue(fake_result(scalar_one_or_none=existing))
 
         with pytest.raises(ConflictException):
             await create_category(request, manager_user, mock_db)
@@ -199,44 +144,21 @@ class TestCreateCategory:
 class TestUpdateCategory:
     """Tests for update_category endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a mock manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-            is_verified=True,
-        )
-
     async def test_update_category_success(self, mock_db, manager_user):
         """Should update a category."""
-        category_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        category_id = fake_uuid()
         category = Category(
             id=category_id,
             name="Roads",
             description="Old description",
             is_active=True,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = category
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=category))
 
-        request = CategoryUpdate(description="New description")
+        request = CategoryUpdate.model_construct(description="New description")
 
         result = await update_category(category_id, request, manager_user, mock_db)
 
@@ -244,61 +166,51 @@ class TestUpdateCategory:
 
     async def test_update_category_not_found(self, mock_db, manager_user):
         """Should raise CategoryNotFoundException when not found."""
-        category_id = uuid.uuid4()
+        category_id = fake_uuid()
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
-        request = CategoryUpdate(description="New description")
+        request = CategoryUpdate.model_construct(description="New description")
 
         with pytest.raises(CategoryNotFoundException):
             await update_category(category_id, request, manager_user, mock_db)
 
     async def test_update_category_duplicate_name(self, mock_db, manager_user):
         """Should raise ConflictException for duplicate name."""
-        category_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        category_id = fake_uuid()
         category = Category(
             id=category_id,
             name="Roads",
             is_active=True,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
         # First call: find category, second call: find duplicate
-        mock_result1 = MagicMock()
-        mock_result1.scalar_one_or_none.return_value = category
-        mock_result2 = MagicMock()
-        mock_result2.scalar_one_or_none.return_value = Category(
-            id=uuid.uuid4(), name="Parks"
+        mock_db.queue_many(
+            fake_result(scalar_one_or_none=category),
+            fake_result(scalar_one_or_none=Category(id=fake_uuid(), name="Parks")),
         )
 
-        mock_db.execute.side_effect = [mock_result1, mock_result2]
-
-        request = CategoryUpdate(name="Parks")
+        request = CategoryUpdate.model_construct(name="Parks")
 
         with pytest.raises(ConflictException):
             await update_category(category_id, request, manager_user, mock_db)
 
     async def test_update_category_deactivate(self, mock_db, manager_user):
         """Should deactivate a category."""
-        category_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        category_id = fake_uuid()
         category = Category(
             id=category_id,
             name="Roads",
             is_active=True,
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = category
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=category))
 
-        request = CategoryUpdate(is_active=False)
+        request = CategoryUpdate.model_construct(is_active=False)
 
         result = await update_category(category_id, request, manager_user, mock_db)
 
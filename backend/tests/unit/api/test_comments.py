@@ -1,75 +1,43 @@
 """Unit tests for comments API endpoints."""
 
-import uuid
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from app.api.v1.comments import list_comments, create_comment
 from app.core.exceptions import ForbiddenException, TicketNotFoundException
-from app.models.comment import Comment
 from app.models.ticket import Ticket
-from app.models.user import User, UserRole
+from app.models.user import User
 from app.schemas.comment import CommentCreate
+from tests.fixtures.factories import NOW, fake_uuid
+from tests.unit.api.conftest import fake_result, populate_on_refresh
 
 
 class TestListComments:
     """Tests for list_comments endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def citizen_user(self):
-        """Create a mock citizen user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Test Citizen",
-            role=UserRole.CITIZEN,
-        )
-
-    @pytest.fixture
-    def support_user(self):
-        """Create a mock support user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905559876543",
-            name="Support User",
-            role=UserRole.SUPPORT,
-        )
-
     async def test_list_comments_citizen_only_public(self, mock_db, citizen_user):
         """Citizens should only see public comments."""
-        ticket_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        ticket_id = fake_uuid()
 
         # Mock ticket exists
-        mock_ticket_result = MagicMock()
-        mock_ticket_result.scalar_one_or_none.return_value = Ticket(id=ticket_id)
+        mock_ticket_result = fake_result(scalar_one_or_none=Ticket(id=ticket_id))
 
         # Mock comments - only public (citizens shouldn't see internal)
-        user_obj = User(id=uuid.uuid4(), name="Commenter")
-        public_comment = MagicMock(spec=Comment)
-        public_comment.id = uuid.uuid4()
-        public_comment.ticket_id = ticket_id
-        public_comment.user_id = user_obj.id
-        public_comment.user = user_obj
-        public_comment.content = "Public comment"
-        public_comment.is_internal = False
-        public_comment.created_at = now
-
-        mock_comments_result = MagicMock()
-        mock_comments_scalars = MagicMock()
-        mock_comments_scalars.all.return_value = [public_comment]
-        mock_comments_result.scalars.return_value = mock_comments_scalars
-
-        mock_db.execute.side_effect = [mock_ticket_result, mock_comments_result]
+        user_obj = User(id=fake_uuid(), name="Commenter")
+        public_comment = SimpleNamespace(
+            id=fake_uuid(),
+            ticket_id=ticket_id,
+            user_id=user_obj.id,
+            user=user_obj,
+            content="Public comment",
+            is_internal=False,
+            created_at=NOW,
+        )
+
+        mock_comments_result = fake_result(scalars=[public_comment])
+
+        mock_db.queue_many(mock_ticket_result, mock_comments_result)
 
         result = await list_comments(ticket_id, citizen_user, mock_db)
 
@@ -78,39 +46,36 @@ class TestListComments:
 
     async def test_list_comments_support_sees_all(self, mock_db, support_user):
         """Support users should see all comments including internal."""
-        ticket_id = uuid.uuid4()
-        now = datetime.now(timezone.utc)
+        ticket_id = fake_uuid()
 
         # Mock ticket exists
-        mock_ticket_result = MagicMock()
-        mock_ticket_result.scalar_one_or_none.return_value = Ticket(id=ticket_id)
-
-        user_obj = User(id=uuid.uuid4(), name="Commenter")
-
-        public_comment = MagicMock(spec=Comment)
-        public_comment.id = uuid.uuid4()
-        public_comment.ticket_id = ticket_id
-        public_comment.user_id = user_obj.id
-        public_comment.user = user_obj
-        public_comment.content = "Public comment"
-        public_comment.is_internal = False
-        public_comment.created_at = now
-
-        internal_comment = MagicMock(spec=Comment)
-        internal_comment.id = uuid.uuid4()
-        internal_comment.ticket_id = ticket_id
-        internal_comment.user_id = user_obj.id
-        internal_comment.user = user_obj
-        internal_comment.content = "Internal note"
-        internal_comment.is_internal = True
-        internal_comment.created_at = now
-
-        mock_comments_result = MagicMock()
-        mock_comments_scalars = MagicMock()
-        mock_comments_scalars.all.return_value = [public_comment, internal_comment]
-        mock_comments_result.scalars.return_value = mock_comments_scalars
-
-        mock_db.execute.side_effect = [mock_ticket_result, mock_comments_result]
+        mock_ticket_result = fake_result(scalar_one_or_none=Ticket(id=ticket_id))
+
+        user_obj = User(id=fake_uuid(), name="Commenter")
+
+        public_comment = SimpleNamespace(
+            id=fake_uuid(),
+            ticket_id=ticket_id,
+            user_id=user_obj.id,
+            user=user_obj,
+            content="Public comment",
+            is_internal=False,
+            created_at=NOW,
+        )
+
+        internal_comment = SimpleNamespace(
+            id=fake_uuid(),
+            ticket_id=ticket_id,
+            user_id=user_obj.id,
+            user=user_obj,
+            content="Internal note",
+            is_internal=True,
+            created_at=NOW,
+        )
+
+        mock_comments_result = fake_result(scalars=[public_comment, internal_comment])
+
+        mock_db.queue_many(mock_ticket_result, mock_comments_result)
 
         result = await list_comments(ticket_id, support_user, mock_db)
 
@@ -118,11 +83,9 @@ class TestListComments:
 
     async def test_list_comments_ticket_not_found(self, mock_db, citizen_user):
         """Should raise TicketNotFoundException when ticket doesn't exist."""
-        ticket_id = uuid.uuid4()
+        ticket_id = fake_uuid()
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
         with pytest.raises(TicketNotFoundException):
             await list_comments(ticket_id, citizen_user, mock_db)
@@ -131,51 +94,17 @@ class TestListComments:
 class TestCreateComment:
     """Tests for create_comment endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def citizen_user(self):
-        """Create a mock citizen user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Test Citizen",
-            role=UserRole.CITIZEN,
-        )
-
-    @pytest.fixture
-    def support_user(self):
-        """Create a mock support user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905559876543",
-            name="Support User",
-            role=UserRole.SUPPORT,
-        )
-
     async def test_create_public_comment_success(self, mock_db, citizen_user):
         """Should create a public comment."""
-        ticket_id = uuid.uuid4()
-        request = CommentCreate(content="This is my comment", is_internal=False)
+        ticket_id = fake_uuid()
+        request = CommentCreate.model_construct(
+            content="This is my comment", is_internal=False
+        )
 
         # Mock ticket exists
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = Ticket(id=ticket_id)
-        mock_db.execute.return_value = mock_result
-
-        async def mock_refresh(comment):
-            comment.id = uuid.uuid4()
-            comment.created_at = datetime.now(timezone.utc)
+        mock_db.queue(fake_result(scalar_one_or_none=Ticket(id=ticket_id)))
 
-        mock_db.refresh = mock_refresh
+        mock_db.refresh = populate_on_refresh
 
         result = await create_comment(ticket_id, request, citizen_user, mock_db)
 
@@ -186,18 +115,14 @@ class TestCreateComment:
 
     async def test_create_internal_comment_by_support(self, mock_db, support_user):
         """Support should be able to create internal comments."""
-        ticket_id = uuid.uuid4()
-        request = CommentCreate(content="Internal note", is_internal=True)
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = Ticket(id=ticket_id)
-        mock_db.execute.return_value = mock_result
+        ticket_id = fake_uuid()
+        request = CommentCreate.model_construct(
+            content="Internal note", is_internal=True
+        )
 
-        async def mock_refresh(comment):
-            comment.id = uuid.uuid4()
-            comment.created_at = datetime.now(timezone.utc)
+        mock_db.queue(fake_result(scalar_one_or_none=Ticket(id=ticket_id)))
 
-        mock_db.refresh = mock_refresh
+        mock_db.refresh = populate_on_refresh
 
         result = await create_comment(ticket_id, request, support_user, mock_db)
 
@@ -205,20 +130,20 @@ class TestCreateComment:
 
     async def test_citizen_cannot_create_internal_comment(self, mock_db, citizen_user):
         """Citizens should not be able to create internal comments."""
-        ticket_id = uuid.uuid4()
-        request = CommentCreate(content="Trying internal", is_internal=True)
+        ticket_id = fake_uuid()
+        request = CommentCreate.model_construct(
+            content="Trying internal", is_internal=True
+        )
 
         with pytest.raises(ForbiddenException):
             await create_comment(ticket_id, request, citizen_user, mock_db)
 
     async def test_create_comment_ticket_not_found(self, mock_db, citizen_user):
         """Should raise TicketNotFoundException when ticket doesn't exist."""
-        ticket_id = uuid.uuid4()
-        request = CommentCreate(content="Comment", is_internal=False)
+        ticket_id = fake_uuid()
+        request = CommentCreate.model_construct(content="Comment", is_internal=False)
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
         with pytest.raises(TicketNotFoundException):
             await create_comment(ticket_id, request, citizen_user, mock_db)
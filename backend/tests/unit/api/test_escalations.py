@@ -1,8 +1,5 @@
 """Unit tests for escalations API endpoints."""
 
-import uuid
-from unittest.mock import AsyncMock, MagicMock
-
 import pytest
 
 from app.api.v1.escalations import (
@@ -22,217 +19,148 @@ from app.models.user import User, UserRole
 from app.models.ticket import Ticket, TicketStatus
 from app.models.escalation import EscalationRequest, EscalationStatus
 from app.schemas.escalation import EscalationCreate, EscalationReview
+from tests.fixtures.factories import fake_uuid
+from tests.unit.api.conftest import fake_result
+
+
+@pytest.fixture
+def team_support_user():
+    """Support user on a team, built fresh for each test."""
+    return User(
+        id=fake_uuid(),
+        phone_number="+905551234567",
+        name="Support",
+        role=UserRole.SUPPORT,
+        team_id=fake_uuid(),
+    )
 
 
 class TestCreateEscalation:
     """Tests for create_escalation endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def support_user(self):
-        """Create a support user with team."""
-        team_id = uuid.uuid4()
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Support",
-            role=UserRole.SUPPORT,
-            team_id=team_id,
-        )
-
-    async def test_create_escalation_success(self, mock_db, support_user):
+    async def test_create_escalation_success(self, mock_db, team_support_user):
         """Should create escalation for ticket assigned to user's team."""
-        ticket_id = uuid.uuid4()
+        ticket_id = fake_uuid()
         ticket = Ticket(
             id=ticket_id,
             title="Test Ticket",
             status=TicketStatus.IN_PROGRESS,
-            team_id=support_user.team_id,
-            reporter_id=uuid.uuid4(),
+            team_id=team_support_user.team_id,
+            reporter_id=fake_uuid(),
         )
 
-        escalation_data = EscalationCreate(
+        escalation_data = EscalationCreate.model_construct(
             ticket_id=ticket_id,
             reason="Need manager review for complex issue",
         )
 
-        # Mock ticket lookup
-        mock_ticket_result = MagicMock()
-        mock_ticket_result.scalar_one_or_none.return_value = ticket
-
-        # Mock existing escalations check
-        mock_escalation_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_escalation_result.scalars.return_value = mock_scalars
-
-        mock_db.execute.side_effect = [mock_ticket_result, mock_escalation_result]
+        # Mock ticket lookup, then the existing escalations check
+        mock_db.queue_many(
+            fake_result(scalar_one_or_none=ticket),
+            fake_result(scalars=[]),
+        )
 
-        result = await create_escalation(escalation_data, support_user, mock_db)
+        result = await create_escalation(escalation_data, team_support_user, mock_db)
 
         assert result.ticket_id == ticket_id
         assert result.status == EscalationStatus.PENDING
         mock_db.add.assert_called()
-        mock_db.commit.assert_called()
+        assert mock_db.commits
 
-    async def test_create_escalation_ticket_not_found(self, mock_db, support_user):
-        """Should raise TicketNotFoundException for non-existent ticket."""
-        escalation_data = EscalationCreate(
-            ticket_id=uuid.uuid4(),
-            reason="Test reason",
-        )
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        with pytest.raises(TicketNotFoundException):
-            await create_escalation(escalation_data, support_user, mock_db)
-
-    async def test_create_escalation_not_assigned_to_team(self, mock_db, support_user):
+    async def test_create_escalation_not_assigned_to_team(
+        self, mock_db, team_support_user
+    ):
         """Should raise ForbiddenException when ticket not assigned to team."""
         ticket = Ticket(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             title="Test Ticket",
             status=TicketStatus.IN_PROGRESS,
             team_id=None,  # Not assigned
-            reporter_id=uuid.uuid4(),
+            reporter_id=fake_uuid(),
         )
 
-        escalation_data = EscalationCreate(
+        escalation_data = EscalationCreate.model_construct(
             ticket_id=ticket.id,
             reason="Test reason",
         )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = ticket
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=ticket))
 
         with pytest.raises(ForbiddenException) as exc_info:
-            await create_escalation(escalation_data, support_user, mock_db)
+            await create_escalation(escalation_data, team_support_user, mock_db)
 
         assert "unassigned" in str(exc_info.value.detail).lower()
 
-    async def test_create_escalation_different_team(self, mock_db, support_user):
+    async def test_create_escalation_different_team(self, mock_db, team_support_user):
         """Should raise ForbiddenException when ticket assigned to different team."""
         ticket = Ticket(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             title="Test Ticket",
             status=TicketStatus.IN_PROGRESS,
-            team_id=uuid.uuid4(),  # Different team
-            reporter_id=uuid.uuid4(),
+            team_id=fake_uuid(),  # Different team
+            reporter_id=fake_uuid(),
         )
 
-        escalation_data = EscalationCreate(
+        escalation_data = EscalationCreate.model_construct(
             ticket_id=ticket.id,
             reason="Test reason",
         )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = ticket
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=ticket))
 
         with pytest.raises(ForbiddenException) as exc_info:
-            await create_escalation(escalation_data, support_user, mock_db)
+            await create_escalation(escalation_data, team_support_user, mock_db)
 
         assert "assigned to your team" in str(exc_info.value.detail)
 
-    async def test_create_escalation_pending_exists(self, mock_db, support_user):
+    async def test_create_escalation_pending_exists(self, mock_db, team_support_user):
         """Should raise EscalationAlreadyExistsException when pending exists."""
         ticket = Ticket(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             title="Test Ticket",
             status=TicketStatus.IN_PROGRESS,
-            team_id=support_user.team_id,
-            reporter_id=uuid.uuid4(),
+            team_id=team_support_user.team_id,
+            reporter_id=fake_uuid(),
         )
 
         pending_escalation = EscalationRequest(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             ticket_id=ticket.id,
             status=EscalationStatus.PENDING,
         )
 
-        escalation_data = EscalationCreate(
+        escalation_data = EscalationCreate.model_construct(
             ticket_id=ticket.id,
             reason="Test reason",
         )
 
-        mock_ticket_result = MagicMock()
-        mock_ticket_result.scalar_one_or_none.return_value = ticket
-
-        mock_escalation_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [pending_escalation]
-        mock_escalation_result.scalars.return_value = mock_scalars
-
-        mock_db.execute.side_effect = [mock_ticket_result, mock_escalation_result]
+        mock_db.queue_many(
+            fake_result(scalar_one_or_none=ticket),
+            fake_result(scalars=[pending_escalation]),
+        )
 
         with pytest.raises(EscalationAlreadyExistsException):
-            await create_escalation(escalation_data, support_user, mock_db)
+            await create_escalation(escalation_data, team_support_user, mock_db)
 
 
 class TestListEscalations:
     """Tests for list_escalations endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def support_user(self):
-        """Create a support user with team."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Support",
-            role=UserRole.SUPPORT,
-            team_id=uuid.uuid4(),
-        )
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905559999999",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
-
     async def test_list_escalations_as_manager(self, mock_db, manager_user):
         """Manager should see all escalations."""
         escalation = EscalationRequest(
-            id=uuid.uuid4(),
-            ticket_id=uuid.uuid4(),
-            requester_id=uuid.uuid4(),
+            id=fake_uuid(),
+            ticket_id=fake_uuid(),
+            requester_id=fake_uuid(),
             status=EscalationStatus.PENDING,
             reason="Test",
         )
 
-        # Mock count
-        mock_count = MagicMock()
-        mock_count.scalar.return_value = 1
-
-        # Mock escalations
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [escalation]
-        mock_result.scalars.return_value = mock_scalars
-
-        mock_db.execute.side_effect = [mock_count, mock_result]
+        # Mock count, then the escalations page
+        mock_db.queue_many(
+            fake_result(scalar=1),
+            fake_result(scalars=[escalation]),
+        )
 
         result = await list_escalations(
             manager_user,
@@ -248,15 +176,10 @@ class TestListEscalations:
 
     async def test_list_escalations_filter_by_status(self, mock_db, manager_user):
         """Should filter escalations by status."""
-        mock_count = MagicMock()
-        mock_count.scalar.return_value = 0
-
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-
-        mock_db.execute.side_effect = [mock_count, mock_result]
+        mock_db.queue_many(
+            fake_result(scalar=0),
+            fake_result(scalars=[]),
+        )
 
         result = await list_escalations(
             manager_user,
@@ -269,202 +192,156 @@ class TestListEscalations:
 
         assert result.total == 0
 
+    async def test_list_escalations_count_only(self, mock_db, manager_user):
+        """count_only should return the total without fetching rows."""
+        mock_db.queue(fake_result(scalar=3))
+
+        result = await list_escalations(
+            manager_user,
+            mock_db,
+            status_filter=None,
+            ticket_id=None,
+            count_only=True,
+            page=1,
+            page_size=10,
+        )
+
+        assert result.total == 3
+        assert result.items == []
+        assert mock_db.executes == 1
+
 
 class TestGetEscalation:
     """Tests for get_escalation endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def support_user(self):
-        """Create a support user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Support",
-            role=UserRole.SUPPORT,
-        )
-
     async def test_get_escalation_success(self, mock_db, support_user):
         """Should return escalation by ID."""
-        escalation_id = uuid.uuid4()
+        escalation_id = fake_uuid()
         escalation = EscalationRequest(
             id=escalation_id,
-            ticket_id=uuid.uuid4(),
+            ticket_id=fake_uuid(),
             requester_id=support_user.id,
             status=EscalationStatus.PENDING,
             reason="Test reason",
         )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = escalation
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=escalation))
 
         result = await get_escalation(escalation_id, support_user, mock_db)
 
         assert result.id == escalation_id
         assert result.status == EscalationStatus.PENDING
 
-    async def test_get_escalation_not_found(self, mock_db, support_user):
-        """Should raise NotFoundException for non-existent escalation."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        with pytest.raises(NotFoundException):
-            await get_escalation(uuid.uuid4(), support_user, mock_db)
-
-
-class TestApproveEscalation:
-    """Tests for approve_escalation endpoint."""
-
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
 
-    async def test_approve_escalation_success(self, mock_db, manager_user):
-        """Should approve pending escalation."""
-        escalation_id = uuid.uuid4()
+class TestReviewEscalation:
+    """Tests for approve_escalation and reject_escalation endpoints."""
+
+    @pytest.mark.parametrize(
+        "endpoint,expected_status",
+        [
+            pytest.param(approve_escalation, EscalationStatus.APPROVED, id="approve"),
+            pytest.param(reject_escalation, EscalationStatus.REJECTED, id="reject"),
+        ],
+    )
+    async def test_review_escalation_success(
+        self, mock_db, manager_user, endpoint, expected_status
+    ):
+        """Should move a pending escalation to the reviewed status."""
+        escalation_id = fake_uuid()
         ticket = Ticket(
-            id=uuid.uuid4(),
+            id=fake_uuid(),
             title="Test Ticket",
             status=TicketStatus.ESCALATED,
         )
         escalation = EscalationRequest(
             id=escalation_id,
             ticket_id=ticket.id,
-            requester_id=uuid.uuid4(),
+            requester_id=fake_uuid(),
             status=EscalationStatus.PENDING,
             reason="Need approval",
         )
         escalation.ticket = ticket
 
-        review_data = EscalationReview(comment="Approved - proceed with fix")
+        review_data = EscalationReview.model_construct(comment="Reviewed")
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = escalation
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=escalation))
 
-        result = await approve_escalation(
-            escalation_id, review_data, manager_user, mock_db
-        )
+        result = await endpoint(escalation_id, review_data, manager_user, mock_db)
 
-        assert result.status == EscalationStatus.APPROVED
+        assert result.status == expected_status
         assert result.reviewer_id == manager_user.id
-        mock_db.commit.assert_called()
-
-    async def test_approve_escalation_not_found(self, mock_db, manager_user):
-        """Should raise NotFoundException for non-existent escalation."""
-        review_data = EscalationReview(comment="Approved")
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        with pytest.raises(NotFoundException):
-            await approve_escalation(uuid.uuid4(), review_data, manager_user, mock_db)
+        assert mock_db.commits
 
     async def test_approve_already_reviewed(self, mock_db, manager_user):
         """Should raise ForbiddenException for already reviewed escalation."""
         escalation = EscalationRequest(
-            id=uuid.uuid4(),
-            ticket_id=uuid.uuid4(),
-            requester_id=uuid.uuid4(),
+            id=fake_uuid(),
+            ticket_id=fake_uuid(),
+            requester_id=fake_uuid(),
             status=EscalationStatus.APPROVED,  # Already approved
             reason="Test",
         )
 
-        review_data = EscalationReview(comment="Try to approve again")
+        review_data = EscalationReview.model_construct(comment="Try to approve again")
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = escalation
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=escalation))
 
         with pytest.raises(ForbiddenException):
             await approve_escalation(escalation.id, review_data, manager_user, mock_db)
 
 
-class TestRejectEscalation:
-    """Tests for reject_escalation endpoint."""
-
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def manager_user(self):
-        """Create a manager user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Manager",
-            role=UserRole.MANAGER,
-        )
-
-    async def test_reject_escalation_success(self, mock_db, manager_user):
-        """Should reject pending escalation."""
-        escalation_id = uuid.uuid4()
-        ticket = Ticket(
-            id=uuid.uuid4(),
-            title="Test Ticket",
-            status=TicketStatus.ESCALATED,
-        )
-        escalation = EscalationRequest(
-            id=escalation_id,
-            ticket_id=ticket.id,
-            requester_id=uuid.uuid4(),
-            status=EscalationStatus.PENDING,
-            reason="Need approval",
-        )
-        escalation.ticket = ticket
-
-        review_data = EscalationReview(comment="Rejected - handle normally")
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = escalation
-        mock_db.execute.return_value = mock_result
-
-        result = await reject_escalation(
-            escalation_id, review_data, manager_user, mock_db
-        )
-
-        assert result.status == EscalationStatus.REJECTED
-        assert result.reviewer_id == manager_user.id
-
-    async def test_reject_escalation_not_found(self, mock_db, manager_user):
-        """Should raise NotFoundException for non-existent escalation."""
-        review_data = EscalationReview(comment="Rejected")
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        with pytest.raises(NotFoundException):
-            await reject_escalation(uuid.uuid4(), review_data, manager_user, mock_db)
+class TestNotFound:
+    """Tests for endpoints whose lookup finds nothing."""
+
+    @pytest.mark.parametrize(
+        "endpoint,args,user_fixture,exc",
+        [
+            pytest.param(
+                create_escalation,
+                (
+                    EscalationCreate.model_construct(
+                        ticket_id=fake_uuid(), reason="Test reason"
+                    ),
+                ),
+                "team_support_user",
+                TicketNotFoundException,
+                id="create",
+            ),
+            pytest.param(
+                get_escalation,
+                (fake_uuid(),),
+                "team_support_user",
+                NotFoundException,
+                id="get",
+            ),
+            pytest.param(
+                approve_escalation,
+                (fake_uuid(), EscalationReview.model_construct(comment="Approved")),
+                "manager_user",
+                NotFoundException,
+                id="approve",
+            ),
+            pytest.param(
+                reject_escalation,
+                (fake_uuid(), EscalationReview.model_construct(comment="Rejected")),
+                "manager_user",
+                NotFoundException,
+                id="reject",
+            ),
+        ],
+    )
+    async def test_not_found(
+        self,
+        mock_db,
+        request: pytest.FixtureRequest,
+        endpoint,
+        args,
+        user_fixture: str,
+        exc,
+    ):
+        """Should raise the endpoint's not-found exception for a missing row."""
+        user = request.getfixturevalue(user_fixture)
+        mock_db.queue(fake_result(scalar_one_or_none=None))
+
+        with pytest.raises(exc):
+            await endpoint(*args, user, mock_db)
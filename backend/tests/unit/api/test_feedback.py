@@ -1,8 +1,6 @@
 """Unit tests for feedback API endpoints."""
 
-import uuid
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -13,54 +11,31 @@ from app.core.exceptions import (
     TicketNotFoundException,
 )
 from app.models.feedback import Feedback
-from app.models.ticket import Ticket, TicketStatus
-from app.models.user import User, UserRole
+from app.models.ticket import TicketStatus
+from app.models.user import User
 from app.schemas.feedback import FeedbackCreate
+from tests.fixtures.factories import NOW, fake_uuid
+from tests.unit.api.conftest import fake_result, populate_on_refresh
 
 
 class TestSubmitFeedback:
     """Tests for submit_feedback endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        db.add = MagicMock()
-        db.commit = AsyncMock()
-        db.refresh = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def citizen_user(self):
-        """Create a mock citizen user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Test Citizen",
-            role=UserRole.CITIZEN,
-        )
-
     async def test_submit_feedback_success(self, mock_db, citizen_user):
         """Should submit feedback for a resolved ticket."""
-        ticket_id = uuid.uuid4()
-        ticket = MagicMock(spec=Ticket)
-        ticket.id = ticket_id
-        ticket.reporter_id = citizen_user.id
-        ticket.status = TicketStatus.RESOLVED
-        ticket.feedback = None
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = ticket
-        mock_db.execute.return_value = mock_result
+        ticket_id = fake_uuid()
+        ticket = SimpleNamespace(
+            id=ticket_id,
+            reporter_id=citizen_user.id,
+            status=TicketStatus.RESOLVED,
+            feedback=None,
+        )
 
-        request = FeedbackCreate(rating=5, comment="Great service!")
+        mock_db.queue(fake_result(scalar_one_or_none=ticket))
 
-        async def mock_refresh(feedback):
-            feedback.id = uuid.uuid4()
-            feedback.created_at = datetime.now(timezone.utc)
+        request = FeedbackCreate.model_construct(rating=5, comment="Great service!")
 
-        mock_db.refresh = mock_refresh
+        mock_db.refresh = populate_on_refresh
 
         result = await submit_feedback(ticket_id, request, citizen_user, mock_db)
 
@@ -71,56 +46,37 @@ class TestSubmitFeedback:
 
     async def test_submit_feedback_closed_ticket(self, mock_db, citizen_user):
         """Should submit feedback for a closed ticket."""
-        ticket_id = uuid.uuid4()
-        ticket = MagicMock(spec=Ticket)
-        ticket.id = ticket_id
-        ticket.reporter_id = citizen_user.id
-        ticket.status = TicketStatus.CLOSED
-        ticket.feedback = None
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = ticket
-        mock_db.execute.return_value = mock_result
+        ticket_id = fake_uuid()
+        ticket = SimpleNamespace(
+            id=ticket_id,
+            reporter_id=citizen_user.id,
+            status=TicketStatus.CLOSED,
+            feedback=None,
+        )
 
-        request = FeedbackCreate(rating=4, comment="Good!")
+        mock_db.queue(fake_result(scalar_one_or_none=ticket))
 
-        async def mock_refresh(feedback):
-            feedback.id = uuid.uuid4()
-            feedback.created_at = datetime.now(timezone.utc)
+        request = FeedbackCreate.model_construct(rating=4, comment="Good!")
 
-        mock_db.refresh = mock_refresh
+        mock_db.refresh = populate_on_refresh
 
         result = await submit_feedback(ticket_id, request, citizen_user, mock_db)
 
         assert result.rating == 4
 
-    async def test_submit_feedback_ticket_not_found(self, mock_db, citizen_user):
-        """Should raise TicketNotFoundException when ticket doesn't exist."""
-        ticket_id = uuid.uuid4()
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
-
-        request = FeedbackCreate(rating=5)
-
-        with pytest.raises(TicketNotFoundException):
-            await submit_feedback(ticket_id, request, citizen_user, mock_db)
-
     async def test_submit_feedback_not_reporter(self, mock_db, citizen_user):
         """Should raise ForbiddenException when user is not the reporter."""
-        ticket_id = uuid.uuid4()
-        ticket = MagicMock(spec=Ticket)
-        ticket.id = ticket_id
-        ticket.reporter_id = uuid.uuid4()  # Different user
-        ticket.status = TicketStatus.RESOLVED
-        ticket.feedback = None
+        ticket_id = fake_uuid()
+        ticket = SimpleNamespace(
+            id=ticket_id,
+            reporter_id=fake_uuid(),  # Different user
+            status=TicketStatus.RESOLVED,
+            feedback=None,
+        )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = ticket
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=ticket))
 
-        request = FeedbackCreate(rating=5)
+        request = FeedbackCreate.model_construct(rating=5)
 
         with pytest.raises(ForbiddenException) as exc_info:
             await submit_feedback(ticket_id, request, citizen_user, mock_db)
@@ -129,18 +85,17 @@ class TestSubmitFeedback:
 
     async def test_submit_feedback_wrong_status(self, mock_db, citizen_user):
         """Should raise ForbiddenException when ticket is not resolved/closed."""
-        ticket_id = uuid.uuid4()
-        ticket = MagicMock(spec=Ticket)
-        ticket.id = ticket_id
-        ticket.reporter_id = citizen_user.id
-        ticket.status = TicketStatus.IN_PROGRESS
-        ticket.feedback = None
+        ticket_id = fake_uuid()
+        ticket = SimpleNamespace(
+            id=ticket_id,
+            reporter_id=citizen_user.id,
+            status=TicketStatus.IN_PROGRESS,
+            feedback=None,
+        )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = ticket
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=ticket))
 
-        request = FeedbackCreate(rating=5)
+        request = FeedbackCreate.model_construct(rating=5)
 
         with pytest.raises(ForbiddenException) as exc_info:
             await submit_feedback(ticket_id, request, citizen_user, mock_db)
@@ -149,18 +104,17 @@ class TestSubmitFeedback:
 
     async def test_submit_feedback_already_exists(self, mock_db, citizen_user):
         """Should raise FeedbackAlreadyExistsException when feedback exists."""
-        ticket_id = uuid.uuid4()
-        ticket = MagicMock(spec=Ticket)
-        ticket.id = ticket_id
-        ticket.reporter_id = citizen_user.id
-        ticket.status = TicketStatus.RESOLVED
-        ticket.feedback = Feedback(id=uuid.uuid4(), rating=5)  # Already has feedback
+        ticket_id = fake_uuid()
+        ticket = SimpleNamespace(
+            id=ticket_id,
+            reporter_id=citizen_user.id,
+            status=TicketStatus.RESOLVED,
+            feedback=Feedback(id=fake_uuid(), rating=5),  # Already has feedback
+        )
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = ticket
-        mock_db.execute.return_value = mock_result
+        mock_db.queue(fake_result(scalar_one_or_none=ticket))
 
-        request = FeedbackCreate(rating=3)
+        request = FeedbackCreate.model_construct(rating=3)
 
         with pytest.raises(FeedbackAlreadyExistsException):
             await submit_feedback(ticket_id, request, citizen_user, mock_db)
@@ -169,41 +123,23 @@ class TestSubmitFeedback:
 class TestGetFeedback:
     """Tests for get_feedback endpoint."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database session."""
-        db = AsyncMock()
-        db.execute = AsyncMock()
-        return db
-
-    @pytest.fixture
-    def citizen_user(self):
-        """Create a mock citizen user."""
-        return User(
-            id=uuid.uuid4(),
-            phone_number="+905551234567",
-            name="Test Citizen",
-            role=UserRole.CITIZEN,
-        )
-
     async def test_get_feedback_success(self, mock_db, citizen_user):
         """Should return feedback for a ticket."""
-        ticket_id = uuid.uuid4()
-        user = User(id=uuid.uuid4(), name="Feedback User")
-        now = datetime.now(timezone.utc)
-
-        feedback = MagicMock(spec=Feedback)
-        feedback.id = uuid.uuid4()
-        feedback.ticket_id = ticket_id
-        feedback.user_id = user.id
-        feedback.user = user
-        feedback.rating = 5
-        feedback.comment = "Excellent!"
-        feedback.created_at = now
-
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = feedback
-        mock_db.execute.return_value = mock_result
+        ticket_id = fake_uuid()
+        user = User(id=fake_uuid(), name="Feedback User")
+
+        feedback = SimpleNamespace(
+            id=fake_uuid(),
+            ticket_id=ticket_id,
+            user_id=user.id,
+            user=user,
+            rating=5,
+            comment="Excellent!",
+            created_at=NOW,
+            updated_at=None,
+        )
+
+        mock_db.queue(fake_result(scalar_one_or_none=feedback))
 
         result = await get_feedback(ticket_id, citizen_user, mock_db)
 
@@ -211,13 +147,24 @@ class TestGetFeedback:
         assert result.comment == "Excellent!"
         assert result.user_name == "Feedback User"
 
-    async def test_get_feedback_not_found(self, mock_db, citizen_user):
-        """Should raise TicketNotFoundException when feedback doesn't exist."""
-        ticket_id = uuid.uuid4()
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+class TestNotFound:
+    """Tests for endpoints whose lookup finds nothing."""
+
+    @pytest.mark.parametrize(
+        "endpoint,args",
+        [
+            pytest.param(
+                submit_feedback,
+                (fake_uuid(), FeedbackCreate.model_construct(rating=5)),
+                id="submit",
+            ),
+            pytest.param(get_feedback, (fake_uuid(),), id="get"),
+        ],
+    )
+    async def test_ticket_not_found(self, mock_db, citizen_user, endpoint, args):
+        """Should raise TicketNotFoundException when the lookup finds nothing."""
+        mock_db.queue(fake_result(scalar_one_or_none=None))
 
         with pytest.raises(TicketNotFoundException):
-            await get_feedback(ticket_id, citizen_user, mock_db)
+            await endpoint(*args, citizen_user, mock_db)
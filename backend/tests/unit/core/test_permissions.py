@@ -1,7 +1,8 @@
 """Tests for permission utilities."""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock
 
 from app.core.permissions import (
     require_roles,
@@ -20,54 +21,26 @@ from app.models import User, UserRole
 class TestRoleChecks:
     """Tests for role checking functions."""
 
-    def test_is_citizen(self):
-        """Should correctly identify citizen role."""
-        user = MagicMock(spec=User)
-        user.role = UserRole.CITIZEN
-        assert is_citizen(user) is True
-
-        user.role = UserRole.SUPPORT
-        assert is_citizen(user) is False
-
-        user.role = UserRole.MANAGER
-        assert is_citizen(user) is False
-
-    def test_is_support(self):
-        """Should correctly identify support role."""
-        user = MagicMock(spec=User)
-        user.role = UserRole.SUPPORT
-        assert is_support(user) is True
-
-        user.role = UserRole.CITIZEN
-        assert is_support(user) is False
-
-        user.role = UserRole.MANAGER
-        assert is_support(user) is False
-
-    def test_is_manager(self):
-        """Should correctly identify manager role."""
-        user = MagicMock(spec=User)
-        user.role = UserRole.MANAGER
-        assert is_manager(user) is True
-
-        user.role = UserRole.CITIZEN
-        assert is_manager(user) is False
-
-        user.role = UserRole.SUPPORT
-        assert is_manager(user) is False
-
-    def test_is_support_or_manager(self):
-        """Should correctly identify support or manager role."""
-        user = MagicMock(spec=User)
-
-        user.role = UserRole.SUPPORT
-        assert is_support_or_manager(user) is True
-
-        user.role = UserRole.MANAGER
-        assert is_support_or_manager(user) is True
-
-        user.role = UserRole.CITIZEN
-        assert is_support_or_manager(user) is False
+    @pytest.mark.parametrize(
+        "checker,role,expected",
+        [
+            (is_citizen, UserRole.CITIZEN, True),
+            (is_citizen, UserRole.SUPPORT, False),
+            (is_citizen, UserRole.MANAGER, False),
+            (is_support, UserRole.CITIZEN, False),
+            (is_support, UserRole.SUPPORT, True),
+            (is_support, UserRole.MANAGER, False),
+            (is_manager, UserRole.CITIZEN, False),
+            (is_manager, UserRole.SUPPORT, False),
+            (is_manager, UserRole.MANAGER, True),
+            (is_support_or_manager, UserRole.CITIZEN, False),
+            (is_support_or_manager, UserRole.SUPPORT, True),
+            (is_support_or_manager, UserRole.MANAGER, True),
+        ],
+    )
+    def test_role_check(self, checker, role, expected):
+        """Should report whether the user has the checked role."""
+        assert checker(SimpleNamespace(role=role)) is expected
 
 
 class TestPermissionChecks:
@@ -75,9 +48,7 @@ class TestPermissionChecks:
 
     def test_can_manage_tickets(self):
         """Support and managers can manage tickets."""
-        user = MagicMock(spec=User)
-
-        user.role = UserRole.SUPPORT
+        user = SimpleNamespace(role=UserRole.SUPPORT)
         assert can_manage_tickets(user) is True
 
         user.role = UserRole.MANAGER
@@ -88,9 +59,7 @@ class TestPermissionChecks:
 
     def test_can_view_analytics(self):
         """Only managers can view analytics."""
-        user = MagicMock(spec=User)
-
-        user.role = UserRole.MANAGER
+        user = SimpleNamespace(role=UserRole.MANAGER)
         assert can_view_analytics(user) is True
 
         user.role = UserRole.SUPPORT
@@ -101,9 +70,7 @@ class TestPermissionChecks:
 
     def test_can_approve_escalations(self):
         """Only managers can approve escalations."""
-        user = MagicMock(spec=User)
-
-        user.role = UserRole.MANAGER
+        user = SimpleNamespace(role=UserRole.MANAGER)
         assert can_approve_escalations(user) is True
 
         user.role = UserRole.SUPPORT
@@ -118,8 +85,7 @@ class TestRequireRolesDecorator:
 
     async def test_require_roles_allows_valid_role(self):
         """Decorator should allow user with valid role."""
-        user = MagicMock(spec=User)
-        user.role = UserRole.MANAGER
+        user = SimpleNamespace(role=UserRole.MANAGER)
 
         @require_roles(UserRole.MANAGER, UserRole.SUPPORT)
         async def protected_endpoint(current_user: User):
@@ -130,8 +96,7 @@ class TestRequireRolesDecorator:
 
     async def test_require_roles_denies_invalid_role(self):
         """Decorator should deny user with invalid role."""
-        user = MagicMock(spec=User)
-        user.role = UserRole.CITIZEN
+        user = SimpleNamespace(role=UserRole.CITIZEN)
 
         @require_roles(UserRole.MANAGER, UserRole.SUPPORT)
         async def protected_endpoint(current_user: User):
@@ -156,8 +121,7 @@ class TestRequireRolesDecorator:
 
     async def test_require_roles_allows_single_role(self):
         """Decorator should work with a single role requirement."""
-        user = MagicMock(spec=User)
-        user.role = UserRole.SUPPORT
+        user = SimpleNamespace(role=UserRole.SUPPORT)
 
         @require_roles(UserRole.SUPPORT)
         async def support_only_endpoint(current_user: User):
@@ -168,8 +132,7 @@ class TestRequireRolesDecorator:
 
     async def test_require_roles_preserves_function_return(self):
         """Decorator should preserve the wrapped function's return value."""
-        user = MagicMock(spec=User)
-        user.role = UserRole.MANAGER
+        user = SimpleNamespace(role=UserRole.MANAGER)
 
         @require_roles(UserRole.MANAGER)
         async def return_data_endpoint(current_user: User):
@@ -72,11 +72,17 @@ class TestOTPGeneration:
 
     def test_generate_otp_code_uniqueness(self):
         """Should generate different codes on each call."""
-        codes = [generate_otp_code() for _ in range(100)]
         # While not guaranteed, with 6 digits we should have variety
-        unique_codes = set(codes)
+        unique_codes = {generate_otp_code() for _ in range(100)}
         assert len(unique_codes) > 50  # Should have at least 50% unique
 
+    def test_generate_otp_code_keeps_requested_length(self):
+        """Should zero-pad codes to the requested length."""
+        for length in (4, 6, 8):
+            code = generate_otp_code(length)
+            assert len(code) == length
+            assert code.isdigit()
+
     def test_get_otp_expiry(self):
         """Should return future datetime."""
         expiry = get_otp_expiry()
@@ -0,0 +1,54 @@
+"""Tests for saved address schema validation."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.address import SavedAddressCreate, SavedAddressUpdate
+
+
+class TestSavedAddressCreate:
+    """Tests for SavedAddressCreate validation."""
+
+    def test_valid_address_defaults_city(self):
+        """Should accept a valid address and default the city."""
+        data = SavedAddressCreate(
+            name="Home",
+            address="123 Main St",
+            latitude=41.0082,
+            longitude=28.9784,
+        )
+        assert data.city == "Istanbul"
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("name", ""),
+            ("latitude", 91),
+            ("longitude", -181),
+        ],
+    )
+    def test_rejects_invalid_field(self, field, value):
+        """Should reject empty names and out-of-range coordinates."""
+        payload = {
+            "name": "Home",
+            "address": "123 Main St",
+            "latitude": 41.0082,
+            "longitude": 28.9784,
+        }
+        payload[field] = value
+        with pytest.raises(ValidationError):
+            SavedAddressCreate(**payload)
+
+
+class TestSavedAddressUpdate:
+    """Tests for SavedAddressUpdate validation."""
+
+    def test_partial_update_tracks_set_fields(self):
+        """Only provided fields should be dumped with exclude_unset."""
+        data = SavedAddressUpdate(name="New Home")
+        assert data.model_dump(exclude_unset=True) == {"name": "New Home"}
+
+    def test_rejects_empty_name(self):
+        """Should reject an empty name."""
+        with pytest.raises(ValidationError):
+            SavedAddressUpdate(name="")